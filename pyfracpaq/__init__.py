@@ -7,10 +7,11 @@ and generate common plots (trace map, rose diagram).
 Modules are intentionally small and focused to make extension easy.
 """
 
-from .types import Segment, Trace, TraceMap
+from .types import Segment, Trace, TraceMap, as_segment_array
 
 __all__ = [
     "Segment",
     "Trace",
     "TraceMap",
+    "as_segment_array",
 ]
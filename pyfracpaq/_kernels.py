@@ -0,0 +1,253 @@
+"""Optional Numba-compiled kernels for large segment arrays.
+
+Numba is not a hard dependency: when it is not installed ``HAVE_NUMBA`` is
+False and callers keep using their NumPy implementations. Numba itself is
+imported (and the kernels compiled) only on first use, so importing this
+module stays cheap.
+"""
+
+from __future__ import annotations
+
+import importlib.util
+import math
+from typing import Optional
+
+import numpy as np
+
+HAVE_NUMBA = importlib.util.find_spec("numba") is not None
+
+# Replaced by numba.prange when the kernels are compiled
+prange = range
+
+# Below this many rows the NumPy path is faster than dispatching to a kernel
+NUMBA_MIN_SEGMENTS = 50_000
+
+
+def _orient_len_py(xy, ang_out, len_out):
+    """Fill ``ang_out`` (degrees in [0, 180)) and ``len_out`` from ``(N, 4)`` rows."""
+    for i in prange(xy.shape[0]):
+        dx = xy[i, 2] - xy[i, 0]
+        dy = xy[i, 3] - xy[i, 1]
+        a = math.degrees(math.atan2(dy, dx)) % 180.0
+        ang_out[i] = 0.0 if abs(a) < 1e-12 else a
+        len_out[i] = math.hypot(dx, dy)
+
+
+def _orient_deg_py(dx, dy):
+    """Orientation in degrees in [0, 180) of one ``dx``/``dy`` pair."""
+    a = math.degrees(math.atan2(dy, dx)) % 180.0
+    return 0.0 if abs(a) < 1e-12 else a
+
+
+def _seg_bounds_py(xy):
+    """Return (xmin, xmax, ymin, ymax) over both endpoints in one sweep."""
+    xmin = xmax = xy[0, 0]
+    ymin = ymax = xy[0, 1]
+    for i in range(xy.shape[0]):
+        for j in (0, 2):
+            x = xy[i, j]
+            y = xy[i, j + 1]
+            if x < xmin:
+                xmin = x
+            elif x > xmax:
+                xmax = x
+            if y < ymin:
+                ymin = y
+            elif y > ymax:
+                ymax = y
+    return xmin, xmax, ymin, ymax
+
+
+def _rose_counts_py(xy, edges, nchunks):
+    """Bidirectional rose counts over ``edges`` (0..360) straight from ``(N, 4)`` rows.
+
+    Each chunk fills its own histogram row (no shared writes); binning follows
+    ``np.histogram`` for uniform edges so results match it exactly.
+    """
+    n = xy.shape[0]
+    bins = edges.shape[0] - 1
+    first = edges[0]
+    norm = bins / (edges[bins] - first)
+    part = np.zeros((nchunks, bins), dtype=np.int64)
+    step = (n + nchunks - 1) // nchunks
+    for c in prange(nchunks):
+        for i in range(c * step, min(n, (c + 1) * step)):
+            a = math.degrees(math.atan2(xy[i, 3] - xy[i, 1], xy[i, 2] - xy[i, 0])) % 180.0
+            # The modulo rounds tiny negative angles up to 180 itself, i.e. 0
+            if a >= 180.0 or abs(a) < 1e-12:
+                a = 0.0
+            for k in range(2):
+                v = a + 180.0 * k
+                j = int((v - first) * norm)
+                if j == bins:
+                    j -= 1
+                if v < edges[j]:
+                    j -= 1
+                elif j != bins - 1 and v >= edges[j + 1]:
+                    j += 1
+                part[c, j] += 1
+    return part.sum(axis=0)
+
+
+def _slip_stresses_py(ang_x, s1, s2, theta, flip_x, flip_y, ang_out, sn_out, tau_out, r_out, r0_out):
+    """Fill North-based angles, normal/shear stress and |tau|/|sn| ratios per segment.
+
+    ``r0_out`` holds the ratios at theta = 0 on the unflipped angles (the
+    slip-tendency normaliser).
+    """
+    mean = 0.5 * (s1 + s2)
+    half = 0.5 * (s1 - s2)
+    for i in prange(ang_x.shape[0]):
+        a0 = (90.0 - ang_x[i]) % 180.0
+        a = a0
+        if flip_x:
+            a = (180.0 - a) % 180.0
+        if flip_y:
+            a = (180.0 - a) % 180.0
+        two_alpha = math.radians(2.0 * ((a + 90.0) - theta))
+        sn = mean + half * math.cos(two_alpha)
+        tau = -half * math.sin(two_alpha)
+        ang_out[i] = a
+        sn_out[i] = sn
+        tau_out[i] = tau
+        r_out[i] = abs(tau) / abs(sn) if abs(sn) > 0 else 0.0
+        two_alpha0 = math.radians(2.0 * (a0 + 90.0))
+        sn0 = mean + half * math.cos(two_alpha0)
+        tau0 = -half * math.sin(two_alpha0)
+        r0_out[i] = abs(tau0) / abs(sn0) if abs(sn0) > 0 else 0.0
+
+
+def _trace_midpoints_py(xy, starts, counts, out):
+    """Fill ``out[t]`` with the point at half the polyline length of trace ``t``.
+
+    Trace ``t`` owns rows ``starts[t]:starts[t] + counts[t]`` of ``xy``; empty
+    traces are left untouched.
+    """
+    for t in prange(counts.shape[0]):
+        c = counts[t]
+        if c == 0:
+            continue
+        s0 = starts[t]
+        total = 0.0
+        for i in range(s0, s0 + c):
+            dx = xy[i, 2] - xy[i, 0]
+            dy = xy[i, 3] - xy[i, 1]
+            total += math.sqrt(dx * dx + dy * dy)
+        if total <= 0:
+            # Degenerate trace: average of its end points
+            out[t, 0] = (xy[s0, 0] + xy[s0 + c - 1, 2]) / 2.0
+            out[t, 1] = (xy[s0, 1] + xy[s0 + c - 1, 3]) / 2.0
+            continue
+        half = total / 2.0
+        acc = 0.0
+        # Numerical edge case default: last endpoint
+        out[t, 0] = xy[s0 + c - 1, 2]
+        out[t, 1] = xy[s0 + c - 1, 3]
+        for i in range(s0, s0 + c):
+            dx = xy[i, 2] - xy[i, 0]
+            dy = xy[i, 3] - xy[i, 1]
+            seg_len = math.sqrt(dx * dx + dy * dy)
+            if acc + seg_len >= half and seg_len > 0:
+                r = (half - acc) / seg_len
+                out[t, 0] = xy[i, 0] + r * dx
+                out[t, 1] = xy[i, 1] + r * dy
+                break
+            acc += seg_len
+
+
+_compiled: Optional[dict] = None
+
+
+def _kernel(name: str):
+    """Return the compiled kernel ``name``, or None when Numba is unavailable."""
+    global _compiled, prange
+    if _compiled is None:
+        _compiled = {}
+        if HAVE_NUMBA:
+            try:
+                import numba  # type: ignore
+            except Exception:  # pragma: no cover - optional dependency
+                return None
+            prange = numba.prange
+            _compiled["seg_bounds"] = numba.njit(cache=True)(_seg_bounds_py)
+            _compiled["orient_len"] = numba.njit(parallel=True, fastmath=True, cache=True)(_orient_len_py)
+            # No fastmath: bin edges must be hit exactly as np.histogram does
+            _compiled["rose_counts"] = numba.njit(parallel=True, cache=True)(_rose_counts_py)
+            # No fastmath either: stresses match the NumPy path below the threshold
+            _compiled["slip_stresses"] = numba.njit(parallel=True, cache=True)(_slip_stresses_py)
+            _compiled["trace_midpoints"] = numba.njit(parallel=True, cache=True)(_trace_midpoints_py)
+            # Elementwise ufunc: the parallel target splits the arrays across threads
+            _compiled["orient_deg"] = numba.vectorize(["f8(f8, f8)"], target="parallel")(_orient_deg_py)
+    return _compiled.get(name)
+
+
+def orient_len(xy: np.ndarray):
+    """Return ``(lengths, orientations_deg)`` via the compiled kernel.
+
+    Returns None when Numba is unavailable so callers can fall back.
+    """
+    kernel = _kernel("orient_len")
+    if kernel is None:
+        return None
+    xy = np.asarray(xy, dtype=np.float64)
+    n = xy.shape[0]
+    ang = np.empty(n, dtype=np.float64)
+    lens = np.empty(n, dtype=np.float64)
+    kernel(xy, ang, lens)
+    return lens, ang
+
+
+def orient_deg(dx: np.ndarray, dy: np.ndarray):
+    """Return orientations in degrees via the parallel ufunc kernel, or None without Numba."""
+    kernel = _kernel("orient_deg")
+    if kernel is None:
+        return None
+    return kernel(np.asarray(dx, dtype=np.float64), np.asarray(dy, dtype=np.float64))
+
+
+def seg_bounds(xy: np.ndarray):
+    """Return ``(xmin, xmax, ymin, ymax)`` of a non-empty ``(N, 4)`` array, or None without Numba."""
+    if xy.shape[0] == 0:
+        return None
+    kernel = _kernel("seg_bounds")
+    if kernel is None:
+        return None
+    return tuple(float(v) for v in kernel(np.asarray(xy, dtype=np.float64)))
+
+
+def rose_counts(xy: np.ndarray, edges: np.ndarray):
+    """Return bidirectional rose counts per bin of ``edges``, or None without Numba."""
+    kernel = _kernel("rose_counts")
+    if kernel is None:
+        return None
+    import numba  # type: ignore  # already loaded by _kernel
+
+    return kernel(np.asarray(xy, dtype=np.float64), np.asarray(edges, dtype=np.float64),
+                  numba.get_num_threads())
+
+
+def slip_stresses(ang_x: np.ndarray, sigma1: float, sigma2: float, theta: float,
+                  flip_x: bool, flip_y: bool):
+    """Return ``(angN, sigma_n, tau, ratios, ratios0)`` per segment, or None without Numba."""
+    kernel = _kernel("slip_stresses")
+    if kernel is None:
+        return None
+    ang_x = np.asarray(ang_x, dtype=np.float64)
+    out = tuple(np.empty(ang_x.shape[0], dtype=np.float64) for _ in range(5))
+    kernel(ang_x, float(sigma1), float(sigma2), float(theta), bool(flip_x), bool(flip_y), *out)
+    return out
+
+
+def trace_midpoints(xy: np.ndarray, seg_counts: np.ndarray):
+    """Return the ``(T, 2)`` half-length points of the non-empty traces, or None without Numba.
+
+    ``xy`` holds the traces' segments back to back, ``seg_counts[t]`` per trace.
+    """
+    kernel = _kernel("trace_midpoints")
+    if kernel is None:
+        return None
+    counts = np.asarray(seg_counts, dtype=np.int64)
+    starts = np.cumsum(counts) - counts
+    out = np.empty((counts.shape[0], 2), dtype=np.float64)
+    kernel(np.asarray(xy, dtype=np.float64), starts, counts, out)
+    return out[counts > 0]
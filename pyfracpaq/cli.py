@@ -3,11 +3,7 @@ from __future__ import annotations
 import argparse
 from pathlib import Path
 
-import matplotlib.pyplot as plt
-
-from .io import read_segments_txt
-from .stats import orientations_deg, lengths
-from .plots import plot_tracemap, plot_rose
+import numpy as np
 
 
 def main(argv: list[str] | None = None) -> int:
@@ -16,31 +12,49 @@ def main(argv: list[str] | None = None) -> int:
     p.add_argument("--bins", type=int, default=18, help="Number of bins for rose diagram")
     p.add_argument("--show", action="store_true", help="Show plots interactively")
     p.add_argument("--save-prefix", type=Path, default=None, help="Prefix path to save figures")
+    p.add_argument("--cache", action="store_true",
+                   help="Cache parsed segments as <input>.npy and reuse it on later runs")
     args = p.parse_args(argv)
 
-    segments = read_segments_txt(args.input)
-    if not segments:
+    # Heavy imports only after argument parsing (keeps --help and errors fast)
+    import matplotlib
+
+    # Nothing is shown when only saving: use the non-interactive Agg backend
+    interactive = args.show or args.save_prefix is None
+    if not interactive:
+        matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+
+    from .io import read_segments_array
+    from .stats import lengths
+    from .plots import plot_tracemap, plot_rose_segments
+
+    segments = read_segments_array(args.input, cache=args.cache)
+    if segments.shape[0] == 0:
         print("No valid segments found.")
         return 1
 
-    ang = orientations_deg(segments)
     lens = lengths(segments)
-    print(f"Segments: {len(segments)}; mean length = {lens.mean():.3f}; median = {lens.median() if hasattr(lens, 'median') else None}")
+    print(f"Segments: {len(segments)}; mean length = {lens.mean():.3f}; median = {np.median(lens):.3f}")
 
     # Trace map
-    ax_map = plot_tracemap(segments)
+    ax_map = plot_tracemap(segments, rasterized=True)
 
     # Rose diagram
-    import numpy as np
-    ax_rose = plot_rose(ang, bins=args.bins)
+    ax_rose = plot_rose_segments(segments, bins=args.bins)
 
     if args.save_prefix is not None:
         prefix = Path(args.save_prefix)
-        ax_map.figure.savefig(prefix.with_suffix("_tracemap.png"))
-        ax_rose.figure.savefig(prefix.with_suffix("_rose.png"))
+        # Explicit dpi/bbox: independent of rcParams and no extra measuring draw
+        for fig, suffix in ((ax_map.figure, "_tracemap.png"), (ax_rose.figure, "_rose.png")):
+            fig.savefig(prefix.with_name(prefix.name + suffix), dpi=fig.dpi, bbox_inches=None)
 
-    if args.show or args.save_prefix is None:
+    if interactive:
         plt.show()
+    else:
+        # Release the figures now (matters when main() runs in a loop)
+        plt.close(ax_map.figure)
+        plt.close(ax_rose.figure)
 
     return 0
 
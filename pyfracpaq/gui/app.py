@@ -10,14 +10,19 @@ from .main_window import MainWindow
 def main(argv: list[str] | None = None) -> int:
     app = QtW.QApplication(sys.argv if argv is None else argv)
     win = MainWindow()
-    # Show first
-    win.show()
-    # Defer maximize to next tick to satisfy some Ubuntu/Wayland WMs
-    def _force_maximize():
+    if app.platformName().startswith("wayland"):
+        # Show first, then defer maximize to next tick to satisfy Wayland WMs
+        win.show()
+
+        def _force_maximize():
+            win.setWindowState(win.windowState() | QtCore.Qt.WindowMaximized)
+            win.raise_()
+            win.activateWindow()
+        QtCore.QTimer.singleShot(0, _force_maximize)
+    else:
+        # Other platforms honour the state directly: first frame is already maximized
         win.setWindowState(win.windowState() | QtCore.Qt.WindowMaximized)
-        win.raise_()
-        win.activateWindow()
-    QtCore.QTimer.singleShot(0, _force_maximize)
+        win.show()
     return app.exec()
 
 
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
@@ -8,6 +9,7 @@ from matplotlib.backends.backend_qtagg import NavigationToolbar2QT as Navigation
 import math
 import numpy as np
 from matplotlib import cm, colors
+from matplotlib.collections import LineCollection
 from matplotlib.patches import Circle
 
 try:
@@ -25,16 +27,183 @@ from .plot_utils import (
     shrink_axes_vertical,
 )
 
+from .._kernels import NUMBA_MIN_SEGMENTS, seg_bounds, trace_midpoints
 from ..io import read_traces_txt
-from ..plots import plot_tracemap
+from ..plots import plot_tracemap, update_tracemap
+from ..stats import orientations_deg, slip_stresses
 from .widgets import MplCanvas
+from .workers import LoadedTraces, TraceLoader, pack_traces
 
 
-class _WheelBlocker(QtCore.QObject):
-    def eventFilter(self, obj, event):
-        if event.type() == QtCore.QEvent.Wheel:
-            return True  # block all wheel events
-        return super().eventFilter(obj, event)
+# Decoded + scaled logos keyed by (candidate paths, height, device pixel ratio);
+# None if no file exists
+_PIXMAP_CACHE: dict[tuple[tuple[str, ...], int, float], Optional[QtGui.QPixmap]] = {}
+
+
+def _cached_scaled_pixmap(candidates: tuple[str, ...], height: int, dpr: float = 1.0) -> Optional[QtGui.QPixmap]:
+    key = (candidates, height, dpr)
+    if key not in _PIXMAP_CACHE:
+        pix = None
+        for c in candidates:
+            p = Path(c)
+            if p.exists():
+                # Scale once in device pixels so HiDPI screens get a sharp logo
+                pix = QtGui.QPixmap(str(p)).scaledToHeight(round(height * dpr), QtCore.Qt.SmoothTransformation)
+                pix.setDevicePixelRatio(dpr)
+                break
+        _PIXMAP_CACHE[key] = pix
+    return _PIXMAP_CACHE[key]
+
+
+def _uniform_bin_index(x: np.ndarray, edges: np.ndarray) -> np.ndarray:
+    """``np.digitize(x, edges) - 1`` for uniform ``edges``, without the binary search.
+
+    The closed-form index can be one off where rounding puts ``x`` on the
+    other side of an edge; comparing against the neighbouring edges fixes it.
+    """
+    nbins = edges.shape[0] - 1
+    j = np.floor((x - edges[0]) * (nbins / (edges[-1] - edges[0]))).astype(np.intp)
+    np.clip(j, 0, nbins - 1, out=j)
+    return j - (x < edges[j]) + (x >= edges[j + 1])
+
+
+@lru_cache(maxsize=1)
+def _csf_palette():
+    """Two-colour CSF palette shared by the map and rose: ``(cmap, norm, lut)``.
+
+    ``lut`` is the read-only ``(2, 4)`` RGBA table, Non-CSF then CSF, so 0/1
+    flags map to colours by plain indexing.
+    """
+    jet = cm.get_cmap('jet')
+    cmap = colors.ListedColormap([jet(0.10), jet(0.90)])
+    norm = colors.BoundaryNorm(boundaries=[-0.5, 0.5, 1.5], ncolors=cmap.N)
+    lut = cmap(norm(np.arange(2)))
+    lut.setflags(write=False)
+    return cmap, norm, lut
+
+
+@lru_cache(maxsize=4)
+def _rose_palette(name: str, dir_bins: int):
+    """Discrete palette of the stress roses: ``(cmap, norm, colours)``.
+
+    Follows the MATLAB rule ``levels = (360/delta)/2 + 1`` with bounds centred
+    on the levels over [0, 1]; ``colours`` is the read-only RGBA per level.
+    """
+    color_levels = int(dir_bins // 2 + 1)
+    bounds = np.concatenate((
+        [0.0],
+        (np.arange(1, color_levels) + 0.5) / color_levels,
+        [1.0],
+    ))
+    cmap = cm.get_cmap(name, color_levels)
+    norm = colors.BoundaryNorm(boundaries=bounds, ncolors=cmap.N, clip=True)
+    discrete_cols = cmap(np.arange(cmap.N))
+    discrete_cols.setflags(write=False)
+    return cmap, norm, discrete_cols
+
+
+def _draw_reference_rings(ax, perc_levels, show_to_perc) -> None:
+    """Equal-area reference circles (one collection) and their % labels up to ``show_to_perc``."""
+    shown = [p for p in perc_levels if p <= show_to_perc]
+    radii = np.sqrt(np.asarray(shown, dtype=float) / 100.0)
+    rings = np.empty((radii.size, _ROSE_THETAS_FULL.size, 2))
+    rings[:, :, 0] = _ROSE_THETAS_FULL
+    rings[:, :, 1] = radii[:, None]
+    _add_lines(ax, rings, 'k', linewidth=0.6)
+    for pperc, r in zip(shown, radii):
+        ax.text(np.pi, r, f"{pperc}%", ha='right', va='center', fontsize=8,
+                bbox=dict(facecolor='white', edgecolor='none', pad=0.2))
+
+
+def _bin_counts(inds: np.ndarray, nbins: int) -> np.ndarray:
+    """Float counts per bin index in [0, nbins); out-of-range indices are ignored."""
+    inds = inds[(inds >= 0) & (inds < nbins)]
+    return np.bincount(inds, minlength=nbins).astype(float)
+
+
+def _add_lines(ax, lines, rgba, linewidth: float = 0.75) -> LineCollection:
+    """Draw many colour-coded lines as one collection, styled like ``ax.plot`` lines."""
+    lc = LineCollection(lines, colors=rgba, linewidths=linewidth,
+                        capstyle="projecting", joinstyle="round")
+    ax.add_collection(lc, autolim=True)
+    return lc
+
+
+def _trace_running_lengths(seg_len: np.ndarray, starts: np.ndarray, counts: np.ndarray) -> tuple:
+    """Length walked along each trace at the start and end of every segment.
+
+    The sums restart at every trace (``starts``/``counts`` of non-empty
+    traces) and run in segment order, as the Numba walk does, so precision
+    depends on the trace's own length rather than the whole map's. Traces
+    are padded into blocks of similar segment counts and summed row-wise.
+    """
+    acc_start = np.empty_like(seg_len)
+    acc_end = np.empty_like(seg_len)
+    # Blocks of traces whose counts share a power of two: padding stays < 2x
+    exps = np.frexp(counts)[1]
+    for e in np.unique(exps):
+        sel = np.nonzero(exps == e)[0]
+        n = counts[sel]
+        cols = np.arange(n.max())
+        mask = cols < n[:, None]
+        rows = (starts[sel][:, None] + cols)[mask]
+        block = np.zeros(mask.shape)
+        block[mask] = seg_len[rows]
+        cum = np.cumsum(block, axis=1)
+        acc_end[rows] = cum[mask]
+        cum[:, 1:] = cum[:, :-1]
+        cum[:, 0] = 0.0
+        acc_start[rows] = cum[mask]
+    return acc_start, acc_end
+
+
+# Preview statistics panel text
+_STATS_TEMPLATE = (
+    "Min. X coordinate: %g\n"
+    "Min. Y coordinate: %g\n"
+    "Max. X coordinate: %g\n"
+    "Max. Y coordinate: %g\n"
+    "Number of traces: %d\n"
+    "Number of segments: %d\n"
+    "Number of nodes: %d"
+)
+
+# Dirty bits for MainWindow._invalidate: batched into one deferred repaint
+_DIRTY_MAP = 1
+_DIRTY_ROSE = 2
+_DIRTY_STATS = 4
+_DIRTY_RUN = 8
+
+# Colorbar ticks of the tendency maps: 0, 0.1, ..., 1 (same values as i / 10)
+_TENDENCY_TICKS = np.arange(11) / 10.0
+_TENDENCY_TICKS.setflags(write=False)
+
+# Upper half of the unit circle at 1-degree steps (Mohr diagrams)
+_MOHR_THETA = np.arange(181) * math.pi / 180.0
+_MOHR_COS = np.cos(_MOHR_THETA)
+_MOHR_SIN = np.sin(_MOHR_THETA)
+
+# Stress roses: 10-degree sectors and a 1-degree circle for the reference rings
+_ROSE_DIR_BINS = 36
+_ROSE_THETA_EDGES = np.linspace(0, 2 * np.pi, _ROSE_DIR_BINS + 1)
+_ROSE_THETAS_FULL = np.linspace(0, 2 * np.pi, 361)
+_ROSE_THETA_EDGES.setflags(write=False)
+_ROSE_THETAS_FULL.setflags(write=False)
+
+# Spin boxes display/parse with a dot decimal separator whatever the system locale
+_EN_US_LOCALE = QtCore.QLocale(QtCore.QLocale.English, QtCore.QLocale.UnitedStates)
+
+
+# Spin boxes that ignore the mouse wheel: the event goes on to the parent panel,
+# and no other events are routed through Python as with an event filter
+class _NoWheelSpin(QtW.QDoubleSpinBox):
+    def wheelEvent(self, event):
+        event.ignore()
+
+
+class _NoWheelIntSpin(QtW.QSpinBox):
+    def wheelEvent(self, event):
+        event.ignore()
 
 
 class MainWindow(QtW.QMainWindow):
@@ -44,10 +213,36 @@ class MainWindow(QtW.QMainWindow):
         self.resize(1200, 800)
 
         # Data
-        self._segments = []
+        # Background file read in progress (guards double submission)
+        self._read_worker = None
+        # Segment endpoints as an (N, 4) x1 y1 x2 y2 array and segments per trace
+        self._seg_xy = np.empty((0, 4), dtype=np.float64)
+        self._seg_counts = np.empty(0, dtype=np.int64)
+        # Preview artists (traces LineCollection, nodes scatter) reused until next load
+        self._map_artists = None
+        # Last preview artists, refilled in place by the next load (None after a clear)
+        self._map_reuse = None
+        # Trace midpoints (along polyline length) for the nodes window, built on first use
+        self._trace_mid_xy = None
+        # Per-segment lengths and x-axis orientations (unflipped), built on first use
+        self._seg_len = None
+        self._seg_orient = None
+        # Last _compute_slip_arrays result as (parameters + flips, arrays)
+        self._slip_cache = None
+        # Last _compute_mechanical_fields result as (parameters + flips, fields)
+        self._fields_cache = None
+        # Pending _DIRTY_* updates, flushed together by _repaint on the next tick
+        self._dirty = 0
+        # Spin boxes created by the builders, configured by _apply_spinbox_preferences
+        self._spinboxes = []
         # Axis flip state for computations/plots
         self._flip_x = False
         self._flip_y = False
+        # Open plot windows follow flips once per burst of clicks (~1 frame)
+        self._flip_timer = QtCore.QTimer(self)
+        self._flip_timer.setSingleShot(True)
+        self._flip_timer.setInterval(16)
+        self._flip_timer.timeout.connect(self._apply_flip_to_open_plots)
         # Cache for scan circle computations (P20/P21)
         self._scan_cache = None
         self._scan_state_token = object()
@@ -76,13 +271,20 @@ class MainWindow(QtW.QMainWindow):
         # Flip indicator on status bar
         self._flip_label = QtW.QLabel("")
         self.statusBar().addPermanentWidget(self._flip_label)
+        # Busy indicator while a file is parsed on the thread pool
+        self._load_progress = QtW.QProgressBar()
+        self._load_progress.setRange(0, 0)
+        self._load_progress.setMaximumWidth(160)
+        self._load_progress.setTextVisible(False)
+        self._load_progress.setVisible(False)
+        self.statusBar().addPermanentWidget(self._load_progress)
         self._update_flip_indicator()
         # Manage multiple plot windows keyed by content
         self._plot_windows = {}
         # Initial left message
         if hasattr(self, "_set_left_message"):
             self._set_left_message("Ready!")
-        # Apply unified behavior to all QDoubleSpinBox: hide arrows and disable wheel
+        # Apply unified behavior to all spin boxes: hide arrows, dot decimal separator
         self._apply_spinbox_preferences()
 
     # ----- UI builders -----
@@ -119,16 +321,16 @@ class MainWindow(QtW.QMainWindow):
         hg = QtW.QGridLayout(hough_box)
         r = 0
         hg.addWidget(QtW.QLabel("Number of Hough peaks"), r, 0)
-        self.edit_houghpeaks = QtW.QSpinBox(); self.edit_houghpeaks.setRange(0, 9999); self.edit_houghpeaks.setValue(1000); self.edit_houghpeaks.setEnabled(False)
+        self.edit_houghpeaks = self._register_spinbox(_NoWheelIntSpin()); self.edit_houghpeaks.setRange(0, 9999); self.edit_houghpeaks.setValue(1000); self.edit_houghpeaks.setEnabled(False)
         hg.addWidget(self.edit_houghpeaks, r, 1); r += 1
         hg.addWidget(QtW.QLabel("Hough threshold"), r, 0)
-        self.edit_houghthreshold = QtW.QDoubleSpinBox(); self.edit_houghthreshold.setRange(0.0, 1.0); self.edit_houghthreshold.setSingleStep(0.01); self.edit_houghthreshold.setValue(0.33); self.edit_houghthreshold.setEnabled(False)
+        self.edit_houghthreshold = self._register_spinbox(_NoWheelSpin()); self.edit_houghthreshold.setRange(0.0, 1.0); self.edit_houghthreshold.setSingleStep(0.01); self.edit_houghthreshold.setValue(0.33); self.edit_houghthreshold.setEnabled(False)
         hg.addWidget(self.edit_houghthreshold, r, 1); r += 1
         hg.addWidget(QtW.QLabel("Merge gaps less than"), r, 0)
-        self.edit_fillgap = QtW.QSpinBox(); self.edit_fillgap.setRange(0, 9999); self.edit_fillgap.setValue(5); self.edit_fillgap.setEnabled(False)
+        self.edit_fillgap = self._register_spinbox(_NoWheelIntSpin()); self.edit_fillgap.setRange(0, 9999); self.edit_fillgap.setValue(5); self.edit_fillgap.setEnabled(False)
         hg.addWidget(self.edit_fillgap, r, 1); r += 1
         hg.addWidget(QtW.QLabel("Discard lengths less than"), r, 0)
-        self.edit_minlength = QtW.QSpinBox(); self.edit_minlength.setRange(0, 999999); self.edit_minlength.setValue(3); self.edit_minlength.setEnabled(False)
+        self.edit_minlength = self._register_spinbox(_NoWheelIntSpin()); self.edit_minlength.setRange(0, 999999); self.edit_minlength.setValue(3); self.edit_minlength.setEnabled(False)
         hg.addWidget(self.edit_minlength, r, 1); r += 1
         self.rb_image.toggled.connect(self._toggle_hough_fields)
         v.addWidget(hough_box)
@@ -152,7 +354,9 @@ class MainWindow(QtW.QMainWindow):
         # Statistics placeholder
         stats_box = QtW.QGroupBox("Statistics for selected file")
         stats_layout = QtW.QVBoxLayout(stats_box)
-        self.txt_stats = QtW.QTextEdit(); self.txt_stats.setReadOnly(True); self.txt_stats.setPlaceholderText("")
+        # Plain-text widget: the stats are never rich text, so skip the HTML document layout
+        self.txt_stats = QtW.QPlainTextEdit(); self.txt_stats.setReadOnly(True); self.txt_stats.setPlaceholderText("")
+        self.txt_stats.setMaximumBlockCount(500)
         stats_layout.addWidget(self.txt_stats)
         v.addWidget(stats_box, 1)
 
@@ -255,6 +459,7 @@ class MainWindow(QtW.QMainWindow):
         tv.addWidget(indented)
         # Toggle enablement e replot quando pai muda
         self.chk_traces_segments.toggled.connect(self._toggle_traces_options)
+        self.chk_show_nodes.toggled.connect(self._on_show_nodes_toggled)
         # Build nested groups to live inside "Maps"
         grp_fs = QtW.QGroupBox("Fracture stability")
         gf = QtW.QGridLayout(grp_fs); r = 0
@@ -275,7 +480,7 @@ class MainWindow(QtW.QMainWindow):
             nonlocal cr
             lab = QtW.QLabel(label)
             cp.addWidget(lab, cr, 0)
-            sp = QtW.QDoubleSpinBox(); sp.setRange(-1e6, 1e6); sp.setDecimals(decimals); sp.setValue(default)
+            sp = self._register_spinbox(_NoWheelSpin()); sp.setRange(-1e6, 1e6); sp.setDecimals(decimals); sp.setValue(default)
             cp.addWidget(sp, cr, 1); cr += 1
             return lab, sp
         self.lbl_sigma1, self.sp_sigma1 = add_param("Sigma 1, MPa", 100.0)
@@ -365,7 +570,7 @@ class MainWindow(QtW.QMainWindow):
         ind_num_l.setSpacing(6)
         lbl_ncircles = QtW.QLabel("Number of scan circles")
         ind_num_l.addWidget(lbl_ncircles)
-        self.spin_ncircles = QtW.QSpinBox(); self.spin_ncircles.setRange(0, 10000); self.spin_ncircles.setValue(12); self.spin_ncircles.setEnabled(False)
+        self.spin_ncircles = self._register_spinbox(_NoWheelIntSpin()); self.spin_ncircles.setRange(0, 10000); self.spin_ncircles.setValue(12); self.spin_ncircles.setEnabled(False)
         ind_num_l.addWidget(self.spin_ncircles)
         gi.addWidget(ind_num, r, 0, 1, 2); r += 1
         # Guardar e iniciar desabilitado para refletir estado visual (texto esmaecido)
@@ -385,8 +590,6 @@ class MainWindow(QtW.QMainWindow):
                 # Ao desmarcar Density, desmarcar também Show scan circles
                 self.chk_showcircles.setChecked(False)
             self._invalidate_scan_cache()
-            self._invalidate_scan_cache()
-            self._invalidate_scan_cache()
         self.chk_est_density.toggled.connect(toggle_scan_circles)
         self.chk_est_intensity.toggled.connect(toggle_scan_circles)
         # Add to Maps group later via a grid
@@ -459,26 +662,36 @@ class MainWindow(QtW.QMainWindow):
         footer.setColumnStretch(2, 1)
         # Place footer under the right tabs column only
         right_col.addLayout(footer)
-        # Connect all checkboxes inside tabs to control Run enablement
-        for cb in self.tab_maps.findChildren(QtW.QCheckBox):
-            cb.toggled.connect(self._update_run_enabled)
+        # Connect all map option checkboxes to control Run enablement;
+        # track how many are checked so toggles don't rescan the widget tree
+        self._map_checkboxes = [
+            self.chk_traces_segments, self.chk_show_nodes,
+            self.chk_traces_by_len, self.chk_segments_by_len, self.chk_segments_by_strike,
+            self.chk_est_intensity, self.chk_est_density, self.chk_showcircles,
+            self.chk_slip, self.chk_dilation, self.chk_suscept, self.chk_crit,
+        ]
+        self._map_checks_on = sum(1 for cb in self._map_checkboxes if cb.isChecked())
+        for cb in self._map_checkboxes:
+            cb.toggled.connect(self._on_map_check_toggled)
         # Set initial state for Run
         self._update_run_enabled()
         return right
 
+    def _register_spinbox(self, sp: QtW.QAbstractSpinBox) -> QtW.QAbstractSpinBox:
+        # Track spin boxes as they are built (no widget-tree walk later)
+        self._spinboxes.append(sp)
+        return sp
+
     def _apply_spinbox_preferences(self) -> None:
-        # Hide up/down arrows and disable mouse wheel for all QDoubleSpinBox in the UI
+        # Hide up/down arrows for all registered spin boxes (wheel is ignored by the classes)
         try:
-            self._wheel_blocker = _WheelBlocker(self)
             # Apply to all spin boxes (integer and double)
-            en_us = QtCore.QLocale(QtCore.QLocale.English, QtCore.QLocale.UnitedStates)
-            for sp in self.findChildren(QtW.QAbstractSpinBox):
+            for sp in self._spinboxes:
                 sp.setButtonSymbols(QtW.QAbstractSpinBox.NoButtons)
                 # Make focus explicit; prevents accidental scroll when not focused
                 sp.setFocusPolicy(QtCore.Qt.StrongFocus)
-                sp.installEventFilter(self._wheel_blocker)
                 # Force dot as decimal separator in display/parse
-                sp.setLocale(en_us)
+                sp.setLocale(_EN_US_LOCALE)
         except Exception:
             pass
 
@@ -514,17 +727,32 @@ class MainWindow(QtW.QMainWindow):
         if not path:
             QtW.QMessageBox.information(self, "No file", "Select a file first.")
             return
-        # Show progress message while reading/plotting
+        if self._read_worker is not None:
+            return
+        # Show progress message while reading; parsing runs on a pool thread
         if self.rb_node.isChecked():
             self._set_left_message("Reading the node file...")
-            QtW.QApplication.processEvents()
-        self.load_file(Path(path))
+        worker = TraceLoader(Path(path))
+        worker.signals.finished.connect(self._on_traces_loaded)
+        self._read_worker = worker
+        self.btn_preview.setEnabled(False)
+        self._load_progress.setVisible(True)
+        QtCore.QThreadPool.globalInstance().start(worker)
+
+    def _on_traces_loaded(self, path: Path, loaded: Optional[LoadedTraces], error) -> None:
+        self._read_worker = None
+        self.btn_preview.setEnabled(True)
+        self._load_progress.setVisible(False)
+        if error is not None:
+            QtW.QMessageBox.critical(self, "Error", f"Failed to load file:\n{error}")
+        else:
+            self._apply_loaded_traces(path, loaded)
         # Final message after preview is drawn
         self._set_left_message("Ready. Click Run to generate maps and graphs.")
 
     def action_run(self) -> None:
         # Generate plots in separate window(s)
-        if not getattr(self, "_segments", []):
+        if not self._seg_xy.shape[0]:
             QtW.QMessageBox.information(self, "No data", "Load and preview a node file first.")
             return
         errors = self._collect_run_validation_errors()
@@ -532,9 +760,10 @@ class MainWindow(QtW.QMainWindow):
             QtW.QMessageBox.warning(self, "Invalid parameters", "\n\n".join(errors))
             return
         # Prepare counts/title used by traces map
-        n_traces = len(getattr(self, "_traces", []))
-        n_segments = len(self._segments)
-        n_nodes = sum((len(t.segments) + 1) for t in getattr(self, "_traces", [])) if getattr(self, "_traces", []) else 0
+        # Counts from the per-trace segment counts (each trace has one more node than segments)
+        n_traces = int(self._seg_counts.size)
+        n_segments = int(self._seg_xy.shape[0])
+        n_nodes = n_segments + n_traces
         title = f"Mapped traces (n = {n_traces}), segments (n = {n_segments}) & nodes (n = {n_nodes})"
         # Traces, segments (with optional Show nodes overlay)
         if self.chk_traces_segments.isChecked():
@@ -676,14 +905,23 @@ class MainWindow(QtW.QMainWindow):
         except Exception as e:
             QtW.QMessageBox.critical(self, "Error", f"Failed to load file:\n{e}")
             return
+        self._apply_loaded_traces(path, pack_traces(traces))
 
-        if not traces:
+    def _apply_loaded_traces(self, path: Path, loaded: LoadedTraces) -> None:
+        if not loaded.traces:
             QtW.QMessageBox.warning(self, "No data", "No valid segments found in file.")
             return
 
-        # Flatten segments for plotting; keep traces for stats
-        self._traces = traces
-        self._segments = [s for t in traces for s in t.segments]
+        # Segments as an (N, 4) array for plotting (packed by the loader); keep traces for stats
+        self._traces = loaded.traces
+        self._seg_counts = loaded.seg_counts
+        self._seg_xy = loaded.seg_xy
+        self._map_artists = None
+        self._trace_mid_xy = None
+        self._seg_len = None
+        self._seg_orient = None
+        self._slip_cache = None
+        self._fields_cache = None
         self._invalidate_scan_cache()
         self.edit_filename.setText(str(path))
         self.statusBar().showMessage("Ready. Click Run to generate maps and graphs.")
@@ -693,9 +931,6 @@ class MainWindow(QtW.QMainWindow):
             if b is not None:
                 b.setEnabled(True)
 
-        self._update_stats()
-        # Show preview in the embedded canvas
-        self._replot_map()
         # Enable tabs and all pages after a successful Preview
         self.tabs.setEnabled(True)
         try:
@@ -703,22 +938,60 @@ class MainWindow(QtW.QMainWindow):
                 self.tabs.setTabEnabled(i, True)
         except Exception:
             pass
-        self._replot_rose()
-        self._update_run_enabled()
+        # Stats, preview map, rose and Run state are refreshed in a single pass
+        self._invalidate(_DIRTY_STATS | _DIRTY_MAP | _DIRTY_ROSE | _DIRTY_RUN)
+
+    def _invalidate(self, flags: int) -> None:
+        """Mark parts of the window dirty; they are refreshed together on the next tick."""
+        if not self._dirty:
+            QtCore.QTimer.singleShot(0, self._repaint)
+        self._dirty |= flags
+
+    def _repaint(self) -> None:
+        dirty, self._dirty = self._dirty, 0
+        if dirty & _DIRTY_STATS:
+            self._update_stats()
+        if dirty & _DIRTY_MAP:
+            self._replot_map(draw=False)
+        if dirty & _DIRTY_ROSE:
+            self._replot_rose()
+        if dirty & _DIRTY_RUN:
+            self._update_run_enabled()
+        if dirty & (_DIRTY_MAP | _DIRTY_ROSE):
+            self.canvas_map.draw_idle()
 
     # ----- Plot helpers -----
-    def _replot_map(self) -> None:
+    def _replot_map(self, draw: bool = True) -> None:
         ax = self.canvas_map.ax
+        # Preview always shows traces; nodes only if enabled and checked
+        show_nodes = bool(self.chk_show_nodes.isEnabled() and self.chk_show_nodes.isChecked())
+        if self._map_artists is not None and self._seg_xy.shape[0]:
+            # Same data already drawn: only toggle the nodes overlay
+            self._map_artists[1].set_visible(show_nodes)
+            if draw:
+                self.canvas_map.blit_artists()
+            return
+        if self._seg_xy.shape[0] and self._refill_map_artists(show_nodes):
+            if draw:
+                self.canvas_map.draw_idle()
+            return
         ax.clear()
-        if self._segments:
+        self._map_reuse = None
+        self.canvas_map.set_blit_artists([])
+        if self._seg_xy.shape[0]:
             # Switch to white plotting background and show axes
             try:
                 self.canvas_map.set_plot_background_white()
             except Exception:
                 pass
-            # Preview always shows traces; nodes only if enabled and checked
-            show_nodes = bool(self.chk_show_nodes.isEnabled() and self.chk_show_nodes.isChecked())
-            plot_tracemap(self._segments, ax=ax, show_nodes=show_nodes)
+            plot_tracemap(self._seg_xy, ax=ax, show_nodes=False, lod=True)
+            # Endpoints as (2N, 2) x/y pairs: a view of the segment array, no copy
+            pts = self._seg_xy.reshape(-1, 2)
+            nodes = ax.scatter(pts[:, 0], pts[:, 1], s=5.0, c="k",
+                               marker='o', alpha=0.7, linewidths=0)
+            nodes.set_visible(show_nodes)
+            self._map_artists = self._map_reuse = (ax.collections[0], nodes)
+            self.canvas_map.set_blit_artists([nodes])
         else:
             # No data: return to placeholder background and hide axes
             try:
@@ -726,11 +999,46 @@ class MainWindow(QtW.QMainWindow):
                 self.canvas_map.set_placeholder_background(bg)
             except Exception:
                 pass
-        self.canvas_map.draw_idle()
+        if draw:
+            self.canvas_map.draw_idle()
+
+    def _refill_map_artists(self, show_nodes: bool) -> bool:
+        """Put newly loaded segments into the previous preview artists.
+
+        Avoids tearing down and rebuilding the axes (ticks, spines, labels) on
+        every load; the view is reset as ``ax.clear()`` + a fresh plot would.
+        Returns False when there is nothing reusable.
+        """
+        if self._map_reuse is None:
+            return False
+        ax = self.canvas_map.ax
+        lc, nodes = self._map_reuse
+        if lc.axes is not ax or nodes.axes is not ax:
+            return False
+        xy = self._seg_xy
+        if not update_tracemap(lc, xy, lod=True):
+            return False
+        pts = xy.reshape(-1, 2)
+        nodes.set_offsets(pts)
+        nodes.set_visible(show_nodes)
+        # Fresh view: limits from the new data only, no leftover inversion
+        ax.ignore_existing_data_limits = True
+        ax.update_datalim(pts)
+        ax.set_autoscale_on(True)
+        if ax.xaxis_inverted():
+            ax.invert_xaxis()
+        if ax.yaxis_inverted():
+            ax.invert_yaxis()
+        ax.autoscale_view()
+        self._map_artists = self._map_reuse
+        return True
 
     def _clear_map_canvas(self) -> None:
         ax = self.canvas_map.ax
         ax.clear()
+        self._map_artists = None
+        self._map_reuse = None
+        self.canvas_map.set_blit_artists([])
         self.canvas_map.draw_idle()
 
     def _replot_rose(self) -> None:
@@ -738,7 +1046,7 @@ class MainWindow(QtW.QMainWindow):
         pass
 
     def action_save_figures(self) -> None:
-        if not self._segments:
+        if not self._seg_xy.shape[0]:
             QtW.QMessageBox.information(self, "Nothing to save", "Load traces first.")
             return
         fn, _ = QtW.QFileDialog.getSaveFileName(
@@ -754,8 +1062,9 @@ class MainWindow(QtW.QMainWindow):
         # Garantir extensão do filtro escolhido
         if base.suffix.lower() not in {".png", ".svg", ".pdf"}:
             base = base.with_suffix(".png")
-        # Save only map on this screen
-        self._replot_map()
+        # Save only map on this screen; savefig renders it, so bring the artists
+        # up to date without also drawing to the screen
+        self._replot_map(draw=False)
         self.canvas_map.figure.savefig(base.with_name(base.stem + "_tracemap" + base.suffix))
         self.statusBar().showMessage(f"Saved figures to {base.parent}")
 
@@ -771,52 +1080,70 @@ class MainWindow(QtW.QMainWindow):
         if not traces:
             self.txt_stats.clear()
             return
-        xs = []
-        ys = []
-        n_segments = 0
-        n_nodes = 0
-        for t in traces:
-            # Accumulate per-trace nodes and segments
-            n_segments += len(t.segments)
-            n_nodes += len(t.segments) + 1
-            for s in t.segments:
-                xs.extend([s.x1, s.x2])
-                ys.extend([s.y1, s.y2])
-        xmin, xmax = min(xs), max(xs)
-        ymin, ymax = min(ys), max(ys)
+        # Each trace has one more node than segments
+        n_segments = int(self._seg_counts.sum())
+        n_nodes = n_segments + int(self._seg_counts.size)
+        xmin, xmax, ymin, ymax = self._segment_limits()
         n_traces = len(traces)
-        lines = [
-            f"Min. X coordinate: {xmin:g}",
-            f"Min. Y coordinate: {ymin:g}",
-            f"Max. X coordinate: {xmax:g}",
-            f"Max. Y coordinate: {ymax:g}",
-            f"Number of traces: {n_traces}",
-            f"Number of segments: {n_segments}",
-            f"Number of nodes: {n_nodes}",
-        ]
-        self.txt_stats.setPlainText("\n".join(lines))
+        self.txt_stats.setPlainText(_STATS_TEMPLATE % (xmin, ymin, xmax, ymax, n_traces, n_segments, n_nodes))
+
+    def _segment_limits(self) -> tuple[float, float, float, float]:
+        """Return (xmin, xmax, ymin, ymax) over all segment endpoints."""
+        a = self._seg_xy
+        if a.shape[0] >= NUMBA_MIN_SEGMENTS:
+            # Single fused min/max sweep when Numba is available
+            bounds = seg_bounds(a)
+            if bounds is not None:
+                return bounds
+        return (
+            float(min(a[:, 0].min(), a[:, 2].min())),
+            float(max(a[:, 0].max(), a[:, 2].max())),
+            float(min(a[:, 1].min(), a[:, 3].min())),
+            float(max(a[:, 1].max(), a[:, 3].max())),
+        )
+
+    def _segment_lengths(self) -> np.ndarray:
+        """Return per-segment lengths, computed once per loaded file."""
+        if self._seg_len is None:
+            xy = self._seg_xy
+            self._seg_len = np.hypot(xy[:, 2] - xy[:, 0], xy[:, 3] - xy[:, 1])
+        return self._seg_len
+
+    def _segment_orientations(self) -> np.ndarray:
+        """Return per-segment orientations from the X-axis in [0, 180), computed once per loaded file.
+
+        Flips are applied by the callers, so toggling them needs no recomputation.
+        """
+        if self._seg_orient is None:
+            self._seg_orient = orientations_deg(self._seg_xy)
+        return self._seg_orient
+
+    def changeEvent(self, event) -> None:
+        # Moving to a screen with another pixel ratio: pick (cached) matching logos
+        if event.type() == QtCore.QEvent.DevicePixelRatioChange:
+            try:
+                self._set_big_logo()
+            except Exception:
+                pass
+        super().changeEvent(event)
 
     def _set_small_header_icon(self) -> None:
-        for p in [
-            Path("FracPaQ_MATLAB/FracPaQicon.jpeg"),
-            Path("FracPaQ_MATLAB/FracPaQicon.jpg"),
-            Path("FracPaQ_MATLAB/FracPaQicon.png"),
-        ]:
-            if p.exists():
-                pix = QtGui.QPixmap(str(p))
-                self.lbl_title_icon.setPixmap(pix.scaledToHeight(40, QtCore.Qt.SmoothTransformation))
-                break
+        pix = _cached_scaled_pixmap((
+            "FracPaQ_MATLAB/FracPaQicon.jpeg",
+            "FracPaQ_MATLAB/FracPaQicon.jpg",
+            "FracPaQ_MATLAB/FracPaQicon.png",
+        ), 40, self.devicePixelRatioF())
+        if pix is not None:
+            self.lbl_title_icon.setPixmap(pix)
 
     def _set_big_logo(self) -> None:
-        for p in [
-            Path("pyfracpaq/gui/PyFracPaQ_logo.jpeg"),
-            Path("pyfracpaq/gui/PyFracPaQ_logo.jpg"),
-            Path("pyfracpaq/gui/PyFracPaQ_logo.png"),
-        ]:
-            if p.exists():
-                pix = QtGui.QPixmap(str(p))
-                self.lbl_biglogo.setPixmap(pix.scaledToHeight(80, QtCore.Qt.SmoothTransformation))
-                break
+        pix = _cached_scaled_pixmap((
+            "pyfracpaq/gui/PyFracPaQ_logo.jpeg",
+            "pyfracpaq/gui/PyFracPaQ_logo.jpg",
+            "pyfracpaq/gui/PyFracPaQ_logo.png",
+        ), 80, self.devicePixelRatioF())
+        if pix is not None:
+            self.lbl_biglogo.setPixmap(pix)
 
     def _toggle_hough_fields(self, on: bool) -> None:
         for w in [self.edit_houghpeaks, self.edit_houghthreshold, self.edit_fillgap, self.edit_minlength]:
@@ -834,16 +1161,31 @@ class MainWindow(QtW.QMainWindow):
         # Embedded canvas no longer reflects immediate plot
         self._update_run_enabled()
 
+    def _on_show_nodes_toggled(self, _: bool = False) -> None:
+        # Nodes on the preview are a blitted overlay: no full redraw needed
+        if self._map_artists is not None:
+            self._replot_map()
+
     def _show_plot_window(self, key: str, window_title: str, plotter, polar: bool = False, refresh_token=None) -> None:
         win = self._plot_windows.get(key)
         if win is not None and win.isVisible():
             if refresh_token is None or getattr(win, '_render_token', None) == refresh_token:
                 win.raise_(); win.activateWindow(); return
+        if win is None and "::" in key:
+            # New parameter set: recycle a closed window of the same kind (and its
+            # Figure) instead of building another one next to it
+            kind = key.split("::", 1)[0] + "::"
+            for old_key, old in list(self._plot_windows.items()):
+                if old_key.startswith(kind) and not old.isVisible():
+                    win = self._plot_windows.pop(old_key)
+                    self._plot_windows[key] = win
+                    break
         # Create window on first use or if it was closed/hidden
         if win is None:
             win = QtW.QMainWindow(self)
             cw = QtW.QWidget(); lay = QtW.QVBoxLayout(cw)
-            canvas = MplCanvas(width=8, height=6, dpi=100, polar=polar)
+            # Manual layout control for attached colorbars and tight titles
+            canvas = MplCanvas(width=8, height=6, dpi=100, polar=polar, constrained=False)
             # Add Matplotlib nav toolbar (zoom, pan, save)
             toolbar = NavigationToolbar(canvas, win)
             lay.addWidget(toolbar)
@@ -851,13 +1193,6 @@ class MainWindow(QtW.QMainWindow):
             win.setCentralWidget(cw)
             win._canvas = canvas
             win._toolbar = toolbar
-            # Prefer manual layout control for attached colorbars and tight titles
-            try:
-                win._canvas.figure.set_constrained_layout(False)
-                # For Matplotlib >=3.8
-                win._canvas.figure.set_layout_engine(None)
-            except Exception:
-                pass
             try:
                 win._canvas.ax._default_position = tuple(win._canvas.ax.get_position().bounds)
             except Exception:
@@ -881,18 +1216,21 @@ class MainWindow(QtW.QMainWindow):
             except Exception:
                 has = 'rectilinear'
             if has != want:
-                cw = win.centralWidget()
-                layout = cw.layout()
-                # Remove old canvas widget
-                layout.removeWidget(win._canvas)
-                win._canvas.setParent(None)
-                # Create new canvas with correct projection and insert after toolbar
-                canvas = MplCanvas(width=8, height=6, dpi=100, polar=polar)
-                layout.addWidget(canvas)
-                win._canvas = canvas
+                # Swap the axes inside the existing Figure (no new canvas widget or buffer)
+                fig = win._canvas.figure
+                fig.clear()
+                try:
+                    # Margins moved by the previous plot's title placement
+                    fig.subplotpars.reset()
+                except Exception:
+                    pass
+                win._canvas.ax = fig.add_subplot(111, projection="polar" if polar else None)
                 try:
-                    win._canvas.figure.set_constrained_layout(False)
-                    win._canvas.figure.set_layout_engine(None)
+                    win._toolbar.update()  # Drop the home/back views of the old axes
+                except Exception:
+                    pass
+                try:
+                    win._canvas.ax.set_facecolor("white")
                 except Exception:
                     pass
                 try:
@@ -937,12 +1275,10 @@ class MainWindow(QtW.QMainWindow):
 
     def _plot_traces_only(self, ax, title: str) -> None:
         # Plot all segments as lines, equal aspect, labels and MATLAB-style title
-        plot_tracemap(self._segments, ax=ax, show_nodes=False)
+        plot_tracemap(self._seg_xy, ax=ax, show_nodes=False, lod=True)
         # Fit limits to data
-        xs = [c for s in self._segments for c in (s.x1, s.x2)]
-        ys = [c for s in self._segments for c in (s.y1, s.y2)]
-        if xs and ys:
-            ax.set_xlim(min(xs), max(xs)); ax.set_ylim(min(ys), max(ys))
+        xmin, xmax, ymin, ymax = self._segment_limits()
+        ax.set_xlim(xmin, xmax); ax.set_ylim(ymin, ymax)
         # Visual axis flips to mirror preview
         self._apply_axis_flip_visual(ax)
         # Reserve fixed margins to create a slightly larger gap between title and axes box
@@ -961,18 +1297,17 @@ class MainWindow(QtW.QMainWindow):
 
     def _plot_traces_with_nodes(self, ax, title: str) -> None:
         # Draw traces first
-        plot_tracemap(self._segments, ax=ax, show_nodes=False)
+        plot_tracemap(self._seg_xy, ax=ax, show_nodes=False, lod=True)
         # Nodes styling (inspired by MATLAB):
         # - Segment endpoints: black filled circles
         # - Segment midpoints: red filled squares
         # - Trace midpoints: green filled triangles (computed along polyline length)
         # Endpoints
-        ex = []; ey = []
-        mx = []; my = []  # segment midpoints
-        for s in self._segments:
-            ex.extend([s.x1, s.x2]); ey.extend([s.y1, s.y2])
-            mx.append((s.x1 + s.x2) / 2.0); my.append((s.y1 + s.y2) / 2.0)
-        if ex:
+        xy = self._seg_xy
+        pts = xy.reshape(-1, 2)
+        ex = pts[:, 0]; ey = pts[:, 1]
+        mx = (xy[:, 0] + xy[:, 2]) / 2.0; my = (xy[:, 1] + xy[:, 3]) / 2.0  # segment midpoints
+        if ex.size:
             ax.plot(
                 ex,
                 ey,
@@ -983,7 +1318,7 @@ class MainWindow(QtW.QMainWindow):
                 markeredgecolor='k',
                 markeredgewidth=0.6,
             )
-        if mx:
+        if mx.size:
             ax.plot(
                 mx,
                 my,
@@ -994,37 +1329,11 @@ class MainWindow(QtW.QMainWindow):
                 markeredgecolor='r',
                 markeredgewidth=0.6,
             )
-        # Trace midpoints: position at half of cumulative length along the polyline
-        tx = []; ty = []
-        for t in getattr(self, "_traces", []):
-            segs = t.segments
-            if not segs:
-                continue
-            total = sum(s.length() for s in segs)
-            if total <= 0:
-                # Fallback: simple average of end points
-                x1, y1 = segs[0].x1, segs[0].y1
-                x2, y2 = segs[-1].x2, segs[-1].y2
-                tx.append((x1 + x2) / 2.0); ty.append((y1 + y2) / 2.0)
-                continue
-            half = total / 2.0
-            acc = 0.0
-            found = False
-            for s in segs:
-                L = s.length()
-                if acc + L >= half and L > 0:
-                    rem = half - acc
-                    r = rem / L
-                    x = s.x1 + r * (s.x2 - s.x1)
-                    y = s.y1 + r * (s.y2 - s.y1)
-                    tx.append(x); ty.append(y)
-                    found = True
-                    break
-                acc += L
-            if not found:
-                # Numerical edge case: place at last endpoint
-                tx.append(segs[-1].x2); ty.append(segs[-1].y2)
-        if tx:
+        # Trace midpoints: computed once per load and reused by every Run
+        if self._trace_mid_xy is None:
+            self._trace_mid_xy = self._compute_trace_midpoints()
+        tx, ty = self._trace_mid_xy
+        if len(tx):
             ax.plot(
                 tx,
                 ty,
@@ -1036,10 +1345,8 @@ class MainWindow(QtW.QMainWindow):
                 markeredgewidth=0.6,
             )
         # Limits, labels, title
-        xs = [c for s in self._segments for c in (s.x1, s.x2)]
-        ys = [c for s in self._segments for c in (s.y1, s.y2)]
-        if xs and ys:
-            ax.set_xlim(min(xs), max(xs)); ax.set_ylim(min(ys), max(ys))
+        xmin, xmax, ymin, ymax = self._segment_limits()
+        ax.set_xlim(xmin, xmax); ax.set_ylim(ymin, ymax)
         ax.set_aspect('equal', adjustable='box')
         ax.set_xlabel('X, pixels'); ax.set_ylabel('Y, pixels')
         # Visual axis flips to mirror preview
@@ -1058,12 +1365,54 @@ class MainWindow(QtW.QMainWindow):
         #cax.set_in_layout(True) 
         title_above_axes(ax, title, offset_points=16.5, top=0.95, adjust_layout=False)
 
+    def _compute_trace_midpoints(self) -> tuple:
+        """Return (xs, ys) of each trace's point at half its cumulative length."""
+        if self._seg_xy.shape[0] >= NUMBA_MIN_SEGMENTS:
+            # Parallel walk over the packed segments when Numba is available
+            mid = trace_midpoints(self._seg_xy, self._seg_counts)
+            if mid is not None:
+                return mid[:, 0], mid[:, 1]
+        xy = self._seg_xy
+        counts = self._seg_counts
+        if not xy.shape[0]:
+            return np.empty(0), np.empty(0)
+        dx = xy[:, 2] - xy[:, 0]
+        dy = xy[:, 3] - xy[:, 1]
+        seg_len = np.sqrt(dx * dx + dy * dy)
+        # Non-empty traces: first/last segment rows and trace index of every segment
+        starts = (np.cumsum(counts) - counts)[counts > 0]
+        lasts = starts + counts[counts > 0] - 1
+        tid = np.repeat(np.arange(starts.size), counts[counts > 0])
+        # Length walked along each trace at the start/end of every segment
+        acc_start, acc_end = _trace_running_lengths(seg_len, starts, counts[counts > 0])
+        total = acc_end[lasts]
+        half = total / 2.0
+        # First segment of each trace whose end reaches half the length
+        reach = (acc_end >= half[tid]) & (seg_len > 0)
+        cand = np.where(reach, np.arange(xy.shape[0]), xy.shape[0])
+        hit = np.minimum.reduceat(cand, starts)
+        found = hit <= lasts
+        i = np.where(found, hit, lasts)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            r = np.where(found, (half - acc_start[i]) / seg_len[i], 1.0)
+        # Numerical edge case (not found): last endpoint, r = 1
+        tx = xy[i, 0] + r * dx[i]
+        ty = xy[i, 1] + r * dy[i]
+        # Zero-length traces: simple average of the end points
+        flat = total <= 0
+        tx[flat] = (xy[starts[flat], 0] + xy[lasts[flat], 2]) / 2.0
+        ty[flat] = (xy[starts[flat], 1] + xy[lasts[flat], 3]) / 2.0
+        return tx, ty
+
     def _plot_traces_by_length(self, ax) -> None:
         traces = [t for t in getattr(self, "_traces", []) if t.segments]
         if not traces:
             return
 
-        lengths = [max(t.total_length(), 0.0) for t in traces]
+        # Trace lengths summed from the cached segment lengths of non-empty traces
+        counts = self._seg_counts
+        starts = (np.cumsum(counts) - counts)[counts > 0]
+        lengths = np.add.reduceat(self._segment_lengths(), starts).tolist()
         positive = [l for l in lengths if l > 0.0]
         if not positive:
             positive = [1.0]
@@ -1090,29 +1439,24 @@ class MainWindow(QtW.QMainWindow):
             cmap = cm.get_cmap('viridis', 256)
         mappable = cm.ScalarMappable(norm=norm, cmap=cmap)
         mappable.set_array([])
-        xs_all = []
-        ys_all = []
-        for trace, length in zip(traces, lengths):
-            segs = trace.segments
-            if not segs:
-                continue
-            xs = [segs[0].x1]
-            ys = [segs[0].y1]
-            for seg in segs:
-                xs.append(seg.x2)
-                ys.append(seg.y2)
-                xs_all.extend([seg.x1, seg.x2])
-                ys_all.extend([seg.y1, seg.y2])
-            if max_len > 0:
-                frac = min(max(length / max_len, 0.0), 1.0)
-            else:
-                frac = 0.0
-            color = cmap(frac)
-            ax.plot(xs, ys, color=color, linewidth=0.75)
+        # One polyline per non-empty trace, sliced from the packed segment array
+        xy = self._seg_xy
+        ends = np.cumsum(counts)
+        lines = [
+            np.vstack((xy[e - c, :2], xy[e - c:e, 2:]))
+            for c, e in zip(counts.tolist(), ends.tolist())
+            if c
+        ]
+        if max_len > 0:
+            fracs = np.clip(np.asarray(lengths) / max_len, 0.0, 1.0)
+        else:
+            fracs = np.zeros(len(lines))
+        _add_lines(ax, lines, cmap(fracs))
 
-        if xs_all and ys_all:
-            ax.set_xlim(min(xs_all), max(xs_all))
-            ax.set_ylim(min(ys_all), max(ys_all))
+        # Limits from the packed endpoint array (same extent as every trace vertex)
+        xmin, xmax, ymin, ymax = self._segment_limits()
+        ax.set_xlim(xmin, xmax)
+        ax.set_ylim(ymin, ymax)
         ax.set_aspect('equal', adjustable='box')
         ax.set_xlabel('X, pixels')
         ax.set_ylabel('Y, pixels')
@@ -1154,11 +1498,12 @@ class MainWindow(QtW.QMainWindow):
         )
 
     def _plot_segments_by_length(self, ax) -> None:
-        segments = list(getattr(self, "_segments", []))
-        if not segments:
+        xy = self._seg_xy
+        if not xy.shape[0]:
             return
 
-        lengths = [max(s.length(), 0.0) for s in segments]
+        lengths_arr = self._segment_lengths()
+        lengths = lengths_arr.tolist()
         positive = [l for l in lengths if l > 0.0]
         if not positive:
             positive = [1.0]
@@ -1186,21 +1531,15 @@ class MainWindow(QtW.QMainWindow):
         mappable = cm.ScalarMappable(norm=norm, cmap=cmap)
         mappable.set_array([])
 
-        xs_all = []
-        ys_all = []
-        for seg, length in zip(segments, lengths):
-            xs_all.extend([seg.x1, seg.x2])
-            ys_all.extend([seg.y1, seg.y2])
-            if max_len > 0:
-                frac = min(max(length / max_len, 0.0), 1.0)
-            else:
-                frac = 0.0
-            color = cmap(frac)
-            ax.plot([seg.x1, seg.x2], [seg.y1, seg.y2], color=color, linewidth=0.75)
+        if max_len > 0:
+            fracs = np.clip(lengths_arr / max_len, 0.0, 1.0)
+        else:
+            fracs = np.zeros_like(lengths_arr)
+        _add_lines(ax, xy.reshape(-1, 2, 2), cmap(fracs))
 
-        if xs_all and ys_all:
-            ax.set_xlim(min(xs_all), max(xs_all))
-            ax.set_ylim(min(ys_all), max(ys_all))
+        xmin, xmax, ymin, ymax = self._segment_limits()
+        ax.set_xlim(xmin, xmax)
+        ax.set_ylim(ymin, ymax)
         ax.set_aspect('equal', adjustable='box')
         ax.set_xlabel('X, pixels')
         ax.set_ylabel('Y, pixels')
@@ -1235,15 +1574,15 @@ class MainWindow(QtW.QMainWindow):
 
         title_above_axes(
             ax,
-            f'Segment length map, n = {len(segments)}',
+            f'Segment length map, n = {xy.shape[0]}',
             offset_points=15,
             top=0.95,
             adjust_layout=False,
         )
 
     def _plot_segments_by_strike(self, ax) -> None:
-        segments = list(getattr(self, "_segments", []))
-        if not segments:
+        xy = self._seg_xy
+        if not xy.shape[0]:
             return
 
         norm = colors.Normalize(vmin=0.0, vmax=180.0)
@@ -1254,25 +1593,18 @@ class MainWindow(QtW.QMainWindow):
         mappable = cm.ScalarMappable(norm=norm, cmap=cmap)
         mappable.set_array([])
 
-        xs_all = []
-        ys_all = []
-        for seg in segments:
-            ang_x = seg.angle_deg()
-            ang = (90.0 - ang_x) % 180.0
-            if self._flip_x:
-                ang = (180.0 - ang) % 180.0
-            if self._flip_y:
-                ang = (180.0 - ang) % 180.0
-            if math.isclose(ang, 0.0, abs_tol=1e-9):
-                ang = 180.0
-            xs_all.extend([seg.x1, seg.x2])
-            ys_all.extend([seg.y1, seg.y2])
-            color = mappable.to_rgba(ang)
-            ax.plot([seg.x1, seg.x2], [seg.y1, seg.y2], color=color, linewidth=0.75)
-
-        if xs_all and ys_all:
-            ax.set_xlim(min(xs_all), max(xs_all))
-            ax.set_ylim(min(ys_all), max(ys_all))
+        # Strike from the x-axis orientation, mirrored by the visual flips
+        ang = (90.0 - self._segment_orientations()) % 180.0
+        if self._flip_x:
+            ang = (180.0 - ang) % 180.0
+        if self._flip_y:
+            ang = (180.0 - ang) % 180.0
+        ang[np.abs(ang) <= 1e-9] = 180.0
+        _add_lines(ax, xy.reshape(-1, 2, 2), mappable.to_rgba(ang))
+
+        xmin, xmax, ymin, ymax = self._segment_limits()
+        ax.set_xlim(xmin, xmax)
+        ax.set_ylim(ymin, ymax)
         ax.set_aspect('equal', adjustable='box')
         ax.set_xlabel('X, pixels')
         ax.set_ylabel('Y, pixels')
@@ -1295,7 +1627,7 @@ class MainWindow(QtW.QMainWindow):
 
         title_above_axes(
             ax,
-            f'Segment strike map, n = {len(segments)}',
+            f'Segment strike map, n = {xy.shape[0]}',
             offset_points=15,
             top=0.95,
             adjust_layout=False,
@@ -1306,8 +1638,7 @@ class MainWindow(QtW.QMainWindow):
         self._scan_state_token = object()
 
     def _scan_signature(self) -> tuple:
-        segments = getattr(self, "_segments", None)
-        seg_id = id(segments) if segments is not None else 0
+        seg_id = id(self._seg_xy)
         try:
             n_circles = int(self.spin_ncircles.value()) if hasattr(self, 'spin_ncircles') else 0
         except Exception:
@@ -1371,6 +1702,23 @@ class MainWindow(QtW.QMainWindow):
             return 'center'
         return 'top'
 
+    def _rose_theta(self, angs_deg: np.ndarray) -> np.ndarray:
+        # Rose angles (degrees) -> flip-aware polar angles in [0, 2*pi), updated in place.
+        # flip_x maps theta -> pi - theta and flip_y theta -> -theta; together they
+        # reduce to one sign and one offset: theta -> sign*theta + offset
+        theta = np.deg2rad(angs_deg)
+        sign = -1.0 if self._flip_x != self._flip_y else 1.0
+        offset = 0.0
+        if self._flip_x:
+            offset = np.pi if not self._flip_y else -np.pi
+        if sign < 0:
+            np.negative(theta, out=theta)
+        if offset:
+            theta += offset
+        theta += 2*np.pi
+        theta %= 2*np.pi
+        return theta
+
     def _plot_intensity_map(self, ax) -> None:
         try:
             grid, intensity, _ = self._compute_intensity_density_arrays()
@@ -1452,16 +1800,14 @@ class MainWindow(QtW.QMainWindow):
             QtW.QMessageBox.information(self, "Cannot draw scan circles", str(exc))
             return
 
-        segments = getattr(self, "_segments", [])
-        if not segments:
+        xy = self._seg_xy
+        if not xy.shape[0]:
             return
 
-        plot_tracemap(segments, ax=ax, show_nodes=False)
-        xs = [c for seg in segments for c in (seg.x1, seg.x2)]
-        ys = [c for seg in segments for c in (seg.y1, seg.y2)]
-        if xs and ys:
-            ax.set_xlim(min(xs), max(xs))
-            ax.set_ylim(min(ys), max(ys))
+        plot_tracemap(xy, ax=ax, show_nodes=False)
+        xmin, xmax, ymin, ymax = self._segment_limits()
+        ax.set_xlim(xmin, xmax)
+        ax.set_ylim(ymin, ymax)
         ax.set_aspect('equal', adjustable='box')
         ax.set_xlabel('X, pixels')
         ax.set_ylabel('Y, pixels')
@@ -1476,15 +1822,15 @@ class MainWindow(QtW.QMainWindow):
 
         title_above_axes(
             ax,
-            f"Mapped trace segments, n = {len(segments)}, scan circles = {self._scan_signature()[1]}",
+            f"Mapped trace segments, n = {xy.shape[0]}, scan circles = {self._scan_signature()[1]}",
             offset_points=16.5,
             top=0.95,
             adjust_layout=False,
         )
 
     def _compute_intensity_density_arrays(self):
-        segments = getattr(self, "_segments", [])
-        if not segments:
+        xy = self._seg_xy
+        if not xy.shape[0]:
             raise ValueError('Load and preview a dataset first.')
         if not hasattr(self, 'spin_ncircles'):
             raise ValueError('Scan circle controls unavailable.')
@@ -1495,13 +1841,13 @@ class MainWindow(QtW.QMainWindow):
         cache = getattr(self, '_scan_cache', None)
         if cache is not None:
             if (
-                cache['segments_id'] == id(segments)
+                cache['segments_id'] == id(xy)
                 and cache['n_circles'] == n_circles
                 and cache.get('token') is self._scan_state_token
             ):
                 return cache['grid'], cache['intensity'], cache['density']
 
-        grid = self._build_scan_circle_grid(segments, n_circles)
+        grid = self._build_scan_circle_grid(n_circles)
         x_centers = grid['x_centers']
         y_centers = grid['y_centers']
         r = grid['radius']
@@ -1511,20 +1857,21 @@ class MainWindow(QtW.QMainWindow):
         intensity = np.zeros((len(y_centers), len(x_centers)), dtype=float)
         density = np.zeros_like(intensity)
         r_sq = r * r
+        rows = xy.tolist()
 
         for ix, cx in enumerate(x_centers):
             for iy, cy in enumerate(y_centers):
                 n_intersections = 0
                 n_endpoints = 0
-                for seg in segments:
-                    m_inc, n_inc = self._segment_circle_stats(seg, cx, cy, r, r_sq)
+                for x1, y1, x2, y2 in rows:
+                    m_inc, n_inc = self._segment_circle_stats(x1, y1, x2, y2, cx, cy, r, r_sq)
                     n_endpoints += m_inc
                     n_intersections += n_inc
                 intensity[iy, ix] = n_intersections / (4.0 * r) if r > 0 else 0.0
                 density[iy, ix] = n_endpoints / (2.0 * math.pi * r_sq) if r_sq > 0 else 0.0
 
         self._scan_cache = {
-            'segments_id': id(segments),
+            'segments_id': id(xy),
             'n_circles': n_circles,
             'grid': grid,
             'intensity': intensity,
@@ -1533,13 +1880,10 @@ class MainWindow(QtW.QMainWindow):
         }
         return grid, intensity, density
 
-    def _build_scan_circle_grid(self, segments, n_circles: int):
-        xs = [c for seg in segments for c in (seg.x1, seg.x2)]
-        ys = [c for seg in segments for c in (seg.y1, seg.y2)]
-        if not xs or not ys:
+    def _build_scan_circle_grid(self, n_circles: int):
+        if not self._seg_xy.shape[0]:
             raise ValueError('Could not determine map limits for scan circles.')
-        x_min, x_max = min(xs), max(xs)
-        y_min, y_max = min(ys), max(ys)
+        x_min, x_max, y_min, y_max = self._segment_limits()
         width = x_max - x_min
         height = y_max - y_min
         if width <= 0 or height <= 0:
@@ -1595,12 +1939,13 @@ class MainWindow(QtW.QMainWindow):
         }
 
     @staticmethod
-    def _segment_circle_stats(seg, cx: float, cy: float, radius: float, radius_sq: float):
+    def _segment_circle_stats(sx1: float, sy1: float, sx2: float, sy2: float,
+                              cx: float, cy: float, radius: float, radius_sq: float):
         tol = 1e-9
-        x1 = seg.x1 - cx
-        y1 = seg.y1 - cy
-        x2 = seg.x2 - cx
-        y2 = seg.y2 - cy
+        x1 = sx1 - cx
+        y1 = sy1 - cy
+        x2 = sx2 - cx
+        y2 = sy2 - cy
         dist1_sq = x1 * x1 + y1 * y1
         dist2_sq = x2 * x2 + y2 * y2
         inside1 = dist1_sq <= radius_sq
@@ -1676,11 +2021,13 @@ class MainWindow(QtW.QMainWindow):
         return f"{value:.3f}"
 
     def _update_plot_window_titles(self) -> None:
+        # Same suffix for every window: build it once per flip
+        suffix = self._flip_title_suffix()
         for win in self._plot_windows.values():
             try:
                 base = getattr(win, '_base_title', win.windowTitle())
                 win._base_title = base
-                win.setWindowTitle(base + self._flip_title_suffix())
+                win.setWindowTitle(base + suffix)
             except Exception:
                 pass
 
@@ -1692,7 +2039,9 @@ class MainWindow(QtW.QMainWindow):
                 proj_name = getattr(ax, 'name', 'rectilinear')
                 if proj_name != 'polar':
                     self._apply_axis_flip_visual(ax)
-                    win._canvas.draw_idle()
+                    # Closed windows are replotted by _show_plot_window when reopened
+                    if win.isVisible():
+                        win._canvas.draw_idle()
             except Exception:
                 pass
 
@@ -1705,13 +2054,13 @@ class MainWindow(QtW.QMainWindow):
                 b.setChecked(self._flip_x)
         try:
             self.canvas_map.ax.invert_xaxis()
-            self.canvas_map.draw_idle()
+            self.canvas_map.queue_redraw()
         except Exception:
             pass
         # Update indicators and apply to open plots
         self._update_flip_indicator()
         self._update_plot_window_titles()
-        self._apply_flip_to_open_plots()
+        self._flip_timer.start()
 
     def _on_flip_y(self) -> None:
         self._flip_y = not self._flip_y
@@ -1720,67 +2069,70 @@ class MainWindow(QtW.QMainWindow):
                 b.setChecked(self._flip_y)
         try:
             self.canvas_map.ax.invert_yaxis()
-            self.canvas_map.draw_idle()
+            self.canvas_map.queue_redraw()
         except Exception:
             pass
         self._update_flip_indicator()
         self._update_plot_window_titles()
-        self._apply_flip_to_open_plots()
+        self._flip_timer.start()
 
     def _compute_slip_arrays(self, sigma1: float, sigma2: float, theta_sigma1: float):
-        # Returns (segment_angles_deg_from_North, sigma_n array, tau array, TsNorm array)
-        # Convert segment angle from X-axis (our data) to North-based (MATLAB style): angN = (90 - angX)
-        angs = []
-        sigmans = []
-        taus = []
-        ratios_theta = []
-        for s in self._segments:
-            angX = s.angle_deg()
-            angN = (90.0 - angX) % 180.0
-            # Apply axis flips to the angle (reverseAxis behavior)
-            if self._flip_x:
-                angN = (180.0 - angN) % 180.0
-            if self._flip_y:
-                angN = (180.0 - angN) % 180.0
-            alpha = (angN + 90.0) - theta_sigma1
-            sn = 0.5 * (sigma1 + sigma2) + 0.5 * (sigma1 - sigma2) * math.cos(math.radians(2.0 * alpha))
-            tau = -0.5 * (sigma1 - sigma2) * math.sin(math.radians(2.0 * alpha))
-            angs.append(angN)
-            sigmans.append(sn)
-            taus.append(tau)
-            ratios_theta.append(abs(tau)/abs(sn) if abs(sn) > 0 else 0.0)
-        # Tsmax with alpha0 = angN + 90 (independent of theta), and without flips per MATLAB
-        ratios0 = []
-        for s in self._segments:
-            angX = s.angle_deg()
-            angN = (90.0 - angX) % 180.0
-            alpha0 = angN + 90.0
-            sn0 = 0.5 * (sigma1 + sigma2) + 0.5 * (sigma1 - sigma2) * math.cos(math.radians(2.0 * alpha0))
-            tau0 = -0.5 * (sigma1 - sigma2) * math.sin(math.radians(2.0 * alpha0))
-            ratios0.append(abs(tau0)/abs(sn0) if abs(sn0) > 0 else 0.0)
-        Tsmax = max(ratios0) if ratios0 else 1.0
-        if Tsmax <= 0:
-            Tsmax = 1.0
-        TsNorm = [max(0.0, min(1.0, r / Tsmax)) for r in ratios_theta]
-        return angs, sigmans, taus, TsNorm
+        # Returns read-only ndarrays (segment_angles_deg_from_North, sigma_n, tau, TsNorm)
+        # North-based (MATLAB style) angles, flip-aware; TsNorm normalised without flips per MATLAB
+        # Maps, Mohr and rose plots of one Run share the same parameters: compute once
+        key = (sigma1, sigma2, theta_sigma1, self._flip_x, self._flip_y)
+        if self._slip_cache is not None and self._slip_cache[0] == key:
+            return self._slip_cache[1]
+        arrays = slip_stresses(
+            self._segment_orientations(), sigma1, sigma2, theta_sigma1, self._flip_x, self._flip_y
+        )
+        for a in arrays:
+            a.setflags(write=False)
+        self._slip_cache = (key, arrays)
+        return arrays
+
+    def _compute_mechanical_fields(self, sigma1: float, sigma2: float, theta_sigma1: float,
+                                   mu: float, C0: float, pf: float) -> dict:
+        # Per-segment fields of the stress maps, from one pass over the slip arrays:
+        # angs, sigmans, taus, ts (normalised slip tendency), td (dilation tendency,
+        # clipped to [0,1]), sf (susceptibility, MPa) and csf (0/1 per MATLAB criterion)
+        key = (sigma1, sigma2, theta_sigma1, mu, C0, pf, self._flip_x, self._flip_y)
+        if self._fields_cache is not None and self._fields_cache[0] == key:
+            return self._fields_cache[1]
+        angs, sigmans, taus, ts = self._compute_slip_arrays(sigma1, sigma2, theta_sigma1)
+        abs_sn = np.abs(sigmans)
+        abs_tau = np.abs(taus)
+        denom = (sigma1 - sigma2) if abs(sigma1 - sigma2) > 1e-12 else 1.0
+        mu_eff = mu if abs(mu) > 1e-12 else 1e-12
+        fields = {
+            'angs': angs,
+            'sigmans': sigmans,
+            'taus': taus,
+            'ts': ts,
+            'td': np.clip((sigma1 - sigmans) / denom, 0.0, 1.0),
+            # Sf = |sn| - pf - (|tau| - C0)/mu  [MPa]
+            'sf': abs_sn - pf - (abs_tau - C0) / mu_eff,
+            # CSF if |tau| >= mu*(|sn| - pf) + C0
+            'csf': (abs_tau >= (mu * (abs_sn - pf) + C0)).astype(int),
+        }
+        for a in fields.values():
+            a.setflags(write=False)
+        self._fields_cache = (key, fields)
+        return fields
 
     def _plot_slip_tendency(self, ax) -> None:
         sigma1 = float(self.sp_sigma1.value()) if hasattr(self, 'sp_sigma1') else 100.0
         sigma2 = float(self.sp_sigma2.value()) if hasattr(self, 'sp_sigma2') else 50.0
         theta_sigma1 = float(self.sp_angle.value()) if hasattr(self, 'sp_angle') else 0.0
-        if not self._segments:
+        if not self._seg_xy.shape[0]:
             return
         angs, sigmans, taus, TsNorm = self._compute_slip_arrays(sigma1, sigma2, theta_sigma1)
         cmap = cm.get_cmap('jet', 100)
         norm = colors.Normalize(vmin=0.0, vmax=1.0)
-        xs_all = []
-        ys_all = []
-        for s, tsn in zip(self._segments, TsNorm):
-            ax.plot([s.x1, s.x2], [s.y1, s.y2], color=cmap(norm(tsn)), lw=0.75)
-            xs_all.extend([s.x1, s.x2]); ys_all.extend([s.y1, s.y2])
-        if xs_all and ys_all:
-            ax.set_xlim(min(xs_all), max(xs_all))
-            ax.set_ylim(min(ys_all), max(ys_all))
+        _add_lines(ax, self._seg_xy.reshape(-1, 2, 2), cmap(norm(TsNorm)))
+        xmin, xmax, ymin, ymax = self._segment_limits()
+        ax.set_xlim(xmin, xmax)
+        ax.set_ylim(ymin, ymax)
         ax.set_aspect('equal', adjustable='box')
         ax.set_xlabel('X, pixels')
         ax.set_ylabel('Y, pixels')
@@ -1800,8 +2152,7 @@ class MainWindow(QtW.QMainWindow):
         cbar.set_label('Normalised slip tendency', labelpad=6)
         # Show ticks from 0 to 1 every 0.1
         try:
-            ticks = [i/10 for i in range(0, 11)]
-            cbar.set_ticks(ticks)
+            cbar.set_ticks(_TENDENCY_TICKS)
         except Exception:
             pass
         # Title above axes with reserved top margin (keep adjust_layout off for stability)
@@ -1816,20 +2167,18 @@ class MainWindow(QtW.QMainWindow):
         sigma1 = float(self.sp_sigma1.value()) if hasattr(self, 'sp_sigma1') else 100.0
         sigma2 = float(self.sp_sigma2.value()) if hasattr(self, 'sp_sigma2') else 50.0
         theta_sigma1 = float(self.sp_angle.value()) if hasattr(self, 'sp_angle') else 0.0
-        if not self._segments:
+        C0 = float(self.sp_cohesion.value()) if hasattr(self, 'sp_cohesion') else 0.0
+        mu = float(self.sp_fric.value()) if hasattr(self, 'sp_fric') else 0.6
+        pf = float(self.sp_pore.value()) if hasattr(self, 'sp_pore') else 0.0
+        if not self._seg_xy.shape[0]:
             return
-        # Reuse stress arrays (sn from slip computation)
-        _, sigmans, _, _ = self._compute_slip_arrays(sigma1, sigma2, theta_sigma1)
+        # Reuse stress arrays (sn from slip computation); the Mohr parameters only key the cache
+        td = self._compute_mechanical_fields(sigma1, sigma2, theta_sigma1, mu, C0, pf)['td']
         cmap = cm.get_cmap('jet', 100)
-        xs_all, ys_all = [], []
-        for s, sn in zip(self._segments, sigmans):
-            denom = (sigma1 - sigma2) if abs(sigma1 - sigma2) > 1e-12 else 1.0
-            td = max(0.0, min(1.0, (sigma1 - sn) / denom))
-            ax.plot([s.x1, s.x2], [s.y1, s.y2], color=cmap(td), lw=0.75)
-            xs_all.extend([s.x1, s.x2]); ys_all.extend([s.y1, s.y2])
-        if xs_all and ys_all:
-            ax.set_xlim(min(xs_all), max(xs_all))
-            ax.set_ylim(min(ys_all), max(ys_all))
+        _add_lines(ax, self._seg_xy.reshape(-1, 2, 2), cmap(td))
+        xmin, xmax, ymin, ymax = self._segment_limits()
+        ax.set_xlim(xmin, xmax)
+        ax.set_ylim(ymin, ymax)
         ax.set_aspect('equal', adjustable='box')
         ax.set_xlabel('X, pixels')
         ax.set_ylabel('Y, pixels')
@@ -1846,7 +2195,7 @@ class MainWindow(QtW.QMainWindow):
         cbar = fig.colorbar(mappable, cax=cax, orientation='horizontal')
         cbar.set_label('Dilation tendency', labelpad=6)
         try:
-            cbar.set_ticks([i/10 for i in range(0, 11)])
+            cbar.set_ticks(_TENDENCY_TICKS)
         except Exception:
             pass
         # Title above axes (keep adjust_layout off for stability)
@@ -1865,35 +2214,25 @@ class MainWindow(QtW.QMainWindow):
         C0 = float(self.sp_cohesion.value()) if hasattr(self, 'sp_cohesion') else 0.0
         mu = float(self.sp_fric.value()) if hasattr(self, 'sp_fric') else 0.6
         pf = float(self.sp_pore.value()) if hasattr(self, 'sp_pore') else 0.0
-        if not self._segments:
+        if not self._seg_xy.shape[0]:
             return
-        _, sigmans, taus, _ = self._compute_slip_arrays(sigma1, sigma2, theta_sigma1)
         # Continuous inverted palette (no discretization). Match MATLAB definition:
         # Sf = |sn| - pf - (|tau| - C0)/mu  [MPa]
         cmap = cm.get_cmap('jet_r', 100)
-        # Compute susceptibility values first to set dynamic color range
-        mu_eff = mu if abs(mu) > 1e-12 else 1e-12
-        Svals = []
-        for sn, t in zip(sigmans, taus):
-            sf = abs(sn) - pf - (abs(t) - C0) / mu_eff
-            Svals.append(sf)
-        if Svals:
-            vmin, vmax = min(Svals), max(Svals)
+        # Susceptibility values first to set dynamic color range
+        Svals = self._compute_mechanical_fields(sigma1, sigma2, theta_sigma1, mu, C0, pf)['sf']
+        if Svals.size:
+            vmin, vmax = float(Svals.min()), float(Svals.max())
             # Avoid zero-width range
             if abs(vmax - vmin) < 1e-12:
                 vmax = vmin + 1.0
         else:
             vmin, vmax = 0.0, 1.0
         norm = colors.Normalize(vmin=vmin, vmax=vmax)
-        xs_all = []
-        ys_all = []
-        for s, sn, t in zip(self._segments, sigmans, taus):
-            sf = abs(sn) - pf - (abs(t) - C0) / mu_eff
-            ax.plot([s.x1, s.x2], [s.y1, s.y2], color=cmap(norm(sf)), lw=0.75)
-            xs_all.extend([s.x1, s.x2]); ys_all.extend([s.y1, s.y2])
-        if xs_all and ys_all:
-            ax.set_xlim(min(xs_all), max(xs_all))
-            ax.set_ylim(min(ys_all), max(ys_all))
+        _add_lines(ax, self._seg_xy.reshape(-1, 2, 2), cmap(norm(Svals)))
+        xmin, xmax, ymin, ymax = self._segment_limits()
+        ax.set_xlim(xmin, xmax)
+        ax.set_ylim(ymin, ymax)
         ax.set_aspect('equal', adjustable='box')
         ax.set_xlabel('X, pixels')
         ax.set_ylabel('Y, pixels')
@@ -1910,10 +2249,10 @@ class MainWindow(QtW.QMainWindow):
         cbar.set_label(r'Fracture susceptibility ($\Delta P_f$), MPa', labelpad=4)
         # Persist chosen ticks/range to reuse in rose without changing map's ticks
         try:
-            self._susc_ticks = [float(t) for t in getattr(cbar, 'get_ticks', lambda: [])()]
+            self._susc_ticks = np.asarray(cbar.get_ticks(), dtype=np.float64)
         except Exception:
             try:
-                self._susc_ticks = [float(tick) for tick in cbar.ax.get_xticks()]
+                self._susc_ticks = np.asarray(cbar.ax.get_xticks(), dtype=np.float64)
             except Exception:
                 self._susc_ticks = None
         self._susc_vmin = vmin
@@ -1949,9 +2288,8 @@ class MainWindow(QtW.QMainWindow):
         # Circle parameters (draw only upper half; y >= 0)
         center = 0.5 * (sigma1 + sigma2)
         radius = 0.5 * abs(sigma1 - sigma2)
-        th = [i * math.pi / 180.0 for i in range(0, 181)]  # 0..180 deg
-        xs = [center + radius * math.cos(t) for t in th]
-        ys = [radius * math.sin(t) for t in th]
+        xs = center + radius * _MOHR_COS
+        ys = radius * _MOHR_SIN
         # Prepare manual layout
         fig = ax.figure
         prepare_figure_layout(fig)
@@ -1977,20 +2315,19 @@ class MainWindow(QtW.QMainWindow):
         ax.set_ylabel('Shear stress, MPa')
         ax.set_aspect('equal', adjustable='box')
         # Fit limits: x start at -5, y starts at 0 (positive only)
-        x_max = max(xs + [x_env[1]])
-        y_max = max([0.0] + ys + y_env)
+        x_max = max(float(xs.max()), x_env[1])
+        y_max = max(0.0, float(ys.max()), *y_env)
         ax.set_xlim(-5, x_max)
         ax.set_ylim(0, 1.05 * y_max)
         # Harmonize major tick spacing across X and Y: use the smaller step
         try:
-            xt = sorted(set(float(v) for v in ax.get_xticks()))
-            yt = sorted(set(float(v) for v in ax.get_yticks()))
-            def _step(vals):
-                diffs = [b - a for a, b in zip(vals, vals[1:])]
-                pos = [d for d in diffs if d > 1e-9]
-                return min(pos) if pos else None
-            sx = _step(xt)
-            sy = _step(yt)
+            def _step(ticks):
+                # Smallest positive gap between the locator's (sorted, unique) ticks
+                diffs = np.diff(np.unique(ticks))
+                diffs = diffs[diffs > 1e-9]
+                return float(diffs.min()) if diffs.size else None
+            sx = _step(ax.get_xticks())
+            sy = _step(ax.get_yticks())
             if sx and sy:
                 s = min(sx, sy)
                 ax.xaxis.set_major_locator(MultipleLocator(s))
@@ -2022,27 +2359,16 @@ class MainWindow(QtW.QMainWindow):
         C0 = float(self.sp_cohesion.value()) if hasattr(self, 'sp_cohesion') else 0.0
         mu = float(self.sp_fric.value()) if hasattr(self, 'sp_fric') else 0.6
         pf = float(self.sp_pore.value()) if hasattr(self, 'sp_pore') else 0.0
-        if not self._segments:
+        if not self._seg_xy.shape[0]:
             return
-        _, sigmans, taus, _ = self._compute_slip_arrays(sigma1, sigma2, theta_sigma1)
         # Classification per MATLAB: CSF if |tau| >= mu*(|sn| - pf) + C0
-        csf_vals = []
-        for sn, t in zip(sigmans, taus):
-            sn_a = abs(sn)
-            t_a = abs(t)
-            csf = 1 if (t_a >= (mu * (sn_a - pf) + C0)) else 0
-            csf_vals.append(csf)
-        # Two-color discrete map
-        cmap = colors.ListedColormap([cm.get_cmap('jet')(0.10), cm.get_cmap('jet')(0.90)])
-        norm = colors.BoundaryNorm(boundaries=[-0.5, 0.5, 1.5], ncolors=cmap.N)
-        xs_all = []
-        ys_all = []
-        for s, csf in zip(self._segments, csf_vals):
-            ax.plot([s.x1, s.x2], [s.y1, s.y2], color=cmap(norm(csf)), lw=0.75)
-            xs_all.extend([s.x1, s.x2]); ys_all.extend([s.y1, s.y2])
-        if xs_all and ys_all:
-            ax.set_xlim(min(xs_all), max(xs_all))
-            ax.set_ylim(min(ys_all), max(ys_all))
+        csf_vals = self._compute_mechanical_fields(sigma1, sigma2, theta_sigma1, mu, C0, pf)['csf']
+        # Two-color discrete map: 0/1 flags index the palette's RGBA table
+        cmap, norm, lut = _csf_palette()
+        _add_lines(ax, self._seg_xy.reshape(-1, 2, 2), lut[csf_vals])
+        xmin, xmax, ymin, ymax = self._segment_limits()
+        ax.set_xlim(xmin, xmax)
+        ax.set_ylim(ymin, ymax)
         ax.set_aspect('equal', adjustable='box')
         ax.set_xlabel('X, pixels')
         ax.set_ylabel('Y, pixels')
@@ -2078,23 +2404,15 @@ class MainWindow(QtW.QMainWindow):
         mu = float(self.sp_fric.value()) if hasattr(self, 'sp_fric') else 0.6
         pf = float(self.sp_pore.value()) if hasattr(self, 'sp_pore') else 0.0
         angs, sigmans, taus, _ = self._compute_slip_arrays(sigma1, sigma2, theta_sigma1)
-        if not angs:
+        if not angs.size:
             return
         mu_eff = mu if abs(mu) > 1e-12 else 1e-12
-        angs2 = angs + [((a + 180.0) % 360.0) for a in angs]
-        dir_bins = 36
-        theta_edges = np.linspace(0, 2*np.pi, dir_bins + 1)
-        theta = np.deg2rad(angs2)
-        if self._flip_x:
-            theta = (np.pi - theta)
-        if self._flip_y:
-            theta = (-theta)
-        theta = (theta + 2*np.pi) % (2*np.pi)
-        inds = np.digitize(theta, theta_edges, right=False) - 1
-        counts = np.zeros(dir_bins)
-        for i in inds:
-            if 0 <= i < dir_bins:
-                counts[i] += 1
+        angs2 = np.concatenate((angs, np.mod(angs + 180.0, 360.0)))
+        dir_bins = _ROSE_DIR_BINS
+        theta_edges = _ROSE_THETA_EDGES
+        theta = self._rose_theta(angs2)
+        inds = _uniform_bin_index(theta, theta_edges)
+        counts = _bin_counts(inds, dir_bins)
         # Polar setup
         ax.set_theta_zero_location('N'); ax.set_theta_direction(-1)
         try:
@@ -2115,8 +2433,7 @@ class MainWindow(QtW.QMainWindow):
         show_to_perc = next((pl for pl in perc_levels if max_perc <= pl), perc_levels[-1])
         show_to = show_to_perc / 100.0
         # Match CSF map palette: two discrete colours (Non-CSF, CSF)
-        cmap = colors.ListedColormap([cm.get_cmap('jet')(0.10), cm.get_cmap('jet')(0.90)])
-        norm = colors.BoundaryNorm(boundaries=[-0.5, 0.5, 1.5], ncolors=cmap.N)
+        cmap, norm, lut = _csf_palette()
 
         def _csf_flag_for_bin(bin_index: int) -> int:
             theta_center = theta_edges[bin_index] + (widths / 2.0)
@@ -2132,13 +2449,13 @@ class MainWindow(QtW.QMainWindow):
             threshold = mu_eff * (sn - pf) + C0
             return 1 if tau >= threshold else 0
 
-        for i in range(dir_bins):
-            csf_flag = _csf_flag_for_bin(i)
-            colour = cmap(norm(csf_flag))
-            ax.bar(
-                theta_edges[i], radii[i], width=widths, bottom=0.0, align='edge',
-                color=colour, edgecolor='white'
-            )
+        # One colormap lookup and one BarContainer for the non-empty sectors
+        csf_flags = np.array([_csf_flag_for_bin(i) for i in range(dir_bins)])
+        shown = radii > 0
+        ax.bar(
+            theta_edges[:-1][shown], radii[shown], width=widths, bottom=0.0, align='edge',
+            color=lut[csf_flags][shown], edgecolor='white'
+        )
         # Margins and colorbar
         reserve_axes_margins(ax, top=0.05, bottom=0.13)
         shrink_axes_vertical(ax, factor=0.90)
@@ -2161,13 +2478,7 @@ class MainWindow(QtW.QMainWindow):
         # Rim and overlays: draw equal-area reference circles and labels (%, up to show_to_perc)
         r_edge = float(np.sqrt(show_to)) if show_to > 0 else 1.0
         ax.set_ylim(0, r_edge)
-        thetas_full = np.linspace(0, 2*np.pi, 361)
-        for pperc in perc_levels:
-            if pperc <= show_to_perc:
-                r = np.sqrt(pperc/100.0)
-                ax.plot(thetas_full, np.full_like(thetas_full, r), color='k', lw=0.6)
-                ax.text(np.pi, r, f"{pperc}%", ha='right', va='center', fontsize=8,
-                        bbox=dict(facecolor='white', edgecolor='none', pad=0.2))
+        _draw_reference_rings(ax, perc_levels, show_to_perc)
         for ang in (0.0, np.pi/2, np.pi, 3*np.pi/2):
             ax.plot([ang, ang], [0, r_edge], color='k', lw=0.5)
         theta_sig = np.deg2rad(theta_sigma1)
@@ -2196,25 +2507,17 @@ class MainWindow(QtW.QMainWindow):
         sigma2 = float(self.sp_sigma2.value()) if hasattr(self, 'sp_sigma2') else 50.0
         theta_sigma1 = float(self.sp_angle.value()) if hasattr(self, 'sp_angle') else 0.0
         angs, _, _, _ = self._compute_slip_arrays(sigma1, sigma2, theta_sigma1)
-        if not angs:
+        if not angs.size:
             return
         # Duplicate for 0..360 coverage
-        angs2 = angs + [((a + 180.0) % 360.0) for a in angs]
+        angs2 = np.concatenate((angs, np.mod(angs + 180.0, 360.0)))
         # Decouple angular resolution from colour resolution to better match MATLAB
-        dir_bins = 36  # finer angular division (e.g., 10° sectors)
-        theta_edges = np.linspace(0, 2*np.pi, dir_bins + 1)
-        theta = np.deg2rad(angs2)
+        dir_bins = _ROSE_DIR_BINS  # finer angular division (10° sectors)
+        theta_edges = _ROSE_THETA_EDGES
         # Apply axis flips to polar angles (cartesian x-right, y-up -> polar E=0, clockwise)
-        if self._flip_x:
-            theta = (np.pi - theta)
-        if self._flip_y:
-            theta = (-theta)
-        theta = (theta + 2*np.pi) % (2*np.pi)
-        inds = np.digitize(theta, theta_edges, right=False) - 1
-        counts = np.zeros(dir_bins)
-        for i in inds:
-            if 0 <= i < dir_bins:
-                counts[i] += 1
+        theta = self._rose_theta(angs2)
+        inds = _uniform_bin_index(theta, theta_edges)
+        counts = _bin_counts(inds, dir_bins)
         # Align orientation with MATLAB: rotate 90° left (North at top)
         ax.set_theta_zero_location('N')
         ax.set_theta_direction(-1)
@@ -2254,19 +2557,11 @@ class MainWindow(QtW.QMainWindow):
         show_to = show_to_perc / 100.0
         # Discrete colours for Ts using independent levels following MATLAB rule:
         # levels = (360/delta)/2 + 1 ≈ dir_bins/2 + 1
-        color_levels = int(dir_bins // 2 + 1)
-        bounds = np.concatenate((
-            [0.0],
-            (np.arange(1, color_levels) + 0.5) / color_levels,
-            [1.0],
-        ))
-        cmap = cm.get_cmap('jet', color_levels)
-        norm = colors.BoundaryNorm(boundaries=bounds, ncolors=cmap.N, clip=True)
-        discrete_cols = cmap(np.arange(cmap.N))
+        cmap, norm, discrete_cols = _rose_palette('jet', dir_bins)
 
         # Maximum slip tendency (Ts_max) using the same definition as MATLAB
-        if angs:
-            rose_angles = np.asarray(angs, dtype=float)
+        if angs.size:
+            rose_angles = angs
             n_alpha = rose_angles + 90.0 - theta_sigma1
             sn_vals = 0.5 * (sigma1 + sigma2) + 0.5 * (sigma1 - sigma2) * np.cos(np.radians(2.0 * n_alpha))
             tau_vals = np.abs(-0.5 * (sigma1 - sigma2) * np.sin(np.radians(2.0 * n_alpha)))
@@ -2294,18 +2589,15 @@ class MainWindow(QtW.QMainWindow):
             ratio = tau / denom
             return max(0.0, min(1.0, ratio / Ts_max))
 
-        for i in range(dir_bins):
-            # Use the same discrete colour indices as the accompanying colorbar
-            ts_norm = _ts_norm_for_bin(i)
-            idx = int(np.clip(norm(ts_norm), 0, cmap.N - 1))
-            try:
-                colour = discrete_cols[idx]
-            except Exception:
-                colour = discrete_cols[0]
-            ax.bar(
-                theta_edges[i], radii[i], width=widths, bottom=0.0, align='edge',
-                color=colour, edgecolor='white'
-            )
+        # Use the same discrete colour indices as the accompanying colorbar,
+        # looked up once for all sectors; empty sectors get no bar at all
+        ts_norms = np.array([_ts_norm_for_bin(i) for i in range(dir_bins)])
+        idx = np.clip(norm(ts_norms), 0, cmap.N - 1)
+        shown = radii > 0
+        ax.bar(
+            theta_edges[:-1][shown], radii[shown], width=widths, bottom=0.0, align='edge',
+            color=discrete_cols[idx][shown], edgecolor='white'
+        )
         # Reserve margins so title/colorbar fit; lower the plot slightly (keeps spacing to title/Azimuth)
         reserve_axes_margins(ax, top=0.05, bottom=0.13)
         # Reduce the polar plot height by ~10% to create a bit more space
@@ -2314,7 +2606,7 @@ class MainWindow(QtW.QMainWindow):
         # Discrete colorbar aligned with the axis width
         mappable = cm.ScalarMappable(norm=norm, cmap=cmap)
         mappable.set_array([])
-        # Show labelled ticks every 0.1 (keep internal discrete bounds at color_levels)
+        # Show labelled ticks every 0.1 (keep internal discrete bounds at the colour levels)
         ticks = np.linspace(0.0, 1.0, 11)
         axis_wide_colorbar(
             ax,
@@ -2333,16 +2625,7 @@ class MainWindow(QtW.QMainWindow):
             r_edge = 1.0
         ax.set_ylim(0, r_edge)
         # Draw reference circles and labels (after bars) up to the chosen bracket
-        thetas_full = np.linspace(0, 2*np.pi, 361)
-        for pperc in perc_levels:
-            if pperc <= show_to_perc:
-                p = pperc / 100.0
-                r = np.sqrt(p)
-                ax.plot(thetas_full, np.full_like(thetas_full, r), color='k', lw=0.6)
-                ax.text(
-                    np.pi, r, f"{pperc}%", ha='right', va='center', fontsize=8,
-                    bbox=dict(facecolor='white', edgecolor='none', pad=0.2)
-                )
+        _draw_reference_rings(ax, perc_levels, show_to_perc)
         # Add cross lines (horizontal and vertical through the origin)
         for ang in (0.0, np.pi/2, np.pi, 3*np.pi/2):
             ax.plot([ang, ang], [0, r_edge], color='k', lw=0.5)
@@ -2375,24 +2658,16 @@ class MainWindow(QtW.QMainWindow):
         theta_sigma1 = float(self.sp_angle.value()) if hasattr(self, 'sp_angle') else 0.0
         # Compute flip-aware segment orientations (for equal-area weighting)
         angs, _, _, _ = self._compute_slip_arrays(sigma1, sigma2, theta_sigma1)
-        if not angs:
+        if not angs.size:
             return
         # Duplicate for 0..360 coverage
-        angs2 = angs + [((a + 180.0) % 360.0) for a in angs]
+        angs2 = np.concatenate((angs, np.mod(angs + 180.0, 360.0)))
         # Angular bins and statistics
-        dir_bins = 36
-        theta_edges = np.linspace(0, 2*np.pi, dir_bins + 1)
-        theta = np.deg2rad(angs2)
-        if self._flip_x:
-            theta = (np.pi - theta)
-        if self._flip_y:
-            theta = (-theta)
-        theta = (theta + 2*np.pi) % (2*np.pi)
-        inds = np.digitize(theta, theta_edges, right=False) - 1
-        counts = np.zeros(dir_bins)
-        for i in inds:
-            if 0 <= i < dir_bins:
-                counts[i] += 1
+        dir_bins = _ROSE_DIR_BINS
+        theta_edges = _ROSE_THETA_EDGES
+        theta = self._rose_theta(angs2)
+        inds = _uniform_bin_index(theta, theta_edges)
+        counts = _bin_counts(inds, dir_bins)
         # Polar setup
         ax.set_theta_zero_location('N'); ax.set_theta_direction(-1)
         try:
@@ -2413,15 +2688,7 @@ class MainWindow(QtW.QMainWindow):
         show_to_perc = next((pl for pl in perc_levels if max_perc <= pl), perc_levels[-1])
         show_to = show_to_perc / 100.0
         # Colors
-        color_levels = int(dir_bins // 2 + 1)
-        bounds = np.concatenate((
-            [0.0],
-            (np.arange(1, color_levels) + 0.5) / color_levels,
-            [1.0],
-        ))
-        cmap = cm.get_cmap('jet', color_levels)
-        norm = colors.BoundaryNorm(boundaries=bounds, ncolors=cmap.N, clip=True)
-        discrete_cols = cmap(np.arange(cmap.N))
+        cmap, norm, discrete_cols = _rose_palette('jet', dir_bins)
         denom = (sigma1 - sigma2)
         if abs(denom) < 1e-12:
             denom = 1.0
@@ -2439,14 +2706,11 @@ class MainWindow(QtW.QMainWindow):
             td = (sigma1 - sn) / denom
             return max(0.0, min(1.0, td))
 
-        for i in range(dir_bins):
-            td_norm = _td_for_bin(i)
-            idx = int(np.clip(norm(td_norm), 0, cmap.N - 1))
-            try:
-                colour = discrete_cols[idx]
-            except Exception:
-                colour = discrete_cols[0]
-            ax.bar(theta_edges[i], radii[i], width=widths, bottom=0.0, align='edge', color=colour, edgecolor='white')
+        td_norms = np.array([_td_for_bin(i) for i in range(dir_bins)])
+        idx = np.clip(norm(td_norms), 0, cmap.N - 1)
+        shown = radii > 0
+        ax.bar(theta_edges[:-1][shown], radii[shown], width=widths, bottom=0.0, align='edge',
+               color=discrete_cols[idx][shown], edgecolor='white')
         # Margins and colorbar
         reserve_axes_margins(ax, top=0.05, bottom=0.13)
         # Create a bit more headroom for title/colorbar consistency with slip rose
@@ -2460,12 +2724,7 @@ class MainWindow(QtW.QMainWindow):
         except Exception:
             r_edge = 1.0
         ax.set_ylim(0, r_edge)
-        thetas_full = np.linspace(0, 2*np.pi, 361)
-        for pperc in perc_levels:
-            if pperc <= show_to_perc:
-                r = np.sqrt(pperc/100.0)
-                ax.plot(thetas_full, np.full_like(thetas_full, r), color='k', lw=0.6)
-                ax.text(np.pi, r, f"{pperc}%", ha='right', va='center', fontsize=8, bbox=dict(facecolor='white', edgecolor='none', pad=0.2))
+        _draw_reference_rings(ax, perc_levels, show_to_perc)
         for ang in (0.0, np.pi/2, np.pi, 3*np.pi/2):
             ax.plot([ang, ang], [0, r_edge], color='k', lw=0.5)
         theta_sig = np.deg2rad(theta_sigma1)
@@ -2497,7 +2756,7 @@ class MainWindow(QtW.QMainWindow):
         pf = float(self.sp_pore.value()) if hasattr(self, 'sp_pore') else 0.0
         # Compute sn,tau with flip-aware angles
         angs, sigmans, taus, _ = self._compute_slip_arrays(sigma1, sigma2, theta_sigma1)
-        if not angs:
+        if not angs.size:
             return
         mu_eff = mu if abs(mu) > 1e-12 else 1e-12
         sn_arr = np.asarray(sigmans, dtype=float)
@@ -2509,21 +2768,13 @@ class MainWindow(QtW.QMainWindow):
             sf_max = sf_min + 1.0
         span = sf_max - sf_min
         # Duplicate for 0..360 coverage
-        angs2 = angs + [((a + 180.0) % 360.0) for a in angs]
+        angs2 = np.concatenate((angs, np.mod(angs + 180.0, 360.0)))
         # Angular bins and statistics
-        dir_bins = 36
-        theta_edges = np.linspace(0, 2*np.pi, dir_bins + 1)
-        theta = np.deg2rad(angs2)
-        if self._flip_x:
-            theta = (np.pi - theta)
-        if self._flip_y:
-            theta = (-theta)
-        theta = (theta + 2*np.pi) % (2*np.pi)
-        inds = np.digitize(theta, theta_edges, right=False) - 1
-        counts = np.zeros(dir_bins)
-        for i in inds:
-            if 0 <= i < dir_bins:
-                counts[i] += 1
+        dir_bins = _ROSE_DIR_BINS
+        theta_edges = _ROSE_THETA_EDGES
+        theta = self._rose_theta(angs2)
+        inds = _uniform_bin_index(theta, theta_edges)
+        counts = _bin_counts(inds, dir_bins)
         # Polar setup
         ax.set_theta_zero_location('N'); ax.set_theta_direction(-1)
         try:
@@ -2544,15 +2795,7 @@ class MainWindow(QtW.QMainWindow):
         show_to_perc = next((pl for pl in perc_levels if max_perc <= pl), perc_levels[-1])
         show_to = show_to_perc / 100.0
         # Colors: discrete variation like Slip/Dilation roses, using Sf range normalised to [0,1]
-        color_levels = int(dir_bins // 2 + 1)
-        bounds_norm = np.concatenate((
-            [0.0],
-            (np.arange(1, color_levels) + 0.5) / color_levels,
-            [1.0],
-        ))
-        cmap = cm.get_cmap('jet_r', color_levels)  # reversed 'jet' (blue=low, red=high)
-        norm = colors.BoundaryNorm(boundaries=bounds_norm, ncolors=cmap.N, clip=True)
-        discrete_cols = cmap(np.arange(cmap.N))
+        cmap, norm, discrete_cols = _rose_palette('jet_r', dir_bins)  # reversed 'jet' (blue=low, red=high)
 
         def _sf_norm_for_bin(bin_index: int) -> float:
             theta_center = theta_edges[bin_index] + (widths / 2.0)
@@ -2569,14 +2812,11 @@ class MainWindow(QtW.QMainWindow):
             sf_norm = (sf - sf_min) / span if span > 0 else 0.0
             return max(0.0, min(1.0, sf_norm))
 
-        for i in range(dir_bins):
-            sf_norm = _sf_norm_for_bin(i)
-            idx = int(np.clip(norm(sf_norm), 0, cmap.N - 1))
-            try:
-                colour = discrete_cols[idx]
-            except Exception:
-                colour = discrete_cols[0]
-            ax.bar(theta_edges[i], radii[i], width=widths, bottom=0.0, align='edge', color=colour, edgecolor='white')
+        sf_norms = np.array([_sf_norm_for_bin(i) for i in range(dir_bins)])
+        idx = np.clip(norm(sf_norms), 0, cmap.N - 1)
+        shown = radii > 0
+        ax.bar(theta_edges[:-1][shown], radii[shown], width=widths, bottom=0.0, align='edge',
+               color=discrete_cols[idx][shown], edgecolor='white')
         # Margins and colorbar (match Slip/Dilation roses)
         reserve_axes_margins(ax, top=0.05, bottom=0.13)
         shrink_axes_vertical(ax, factor=0.90)
@@ -2610,12 +2850,7 @@ class MainWindow(QtW.QMainWindow):
         except Exception:
             r_edge = 1.0
         ax.set_ylim(0, r_edge)
-        thetas_full = np.linspace(0, 2*np.pi, 361)
-        for pperc in perc_levels:
-            if pperc <= show_to_perc:
-                r = np.sqrt(pperc/100.0)
-                ax.plot(thetas_full, np.full_like(thetas_full, r), color='k', lw=0.6)
-                ax.text(np.pi, r, f"{pperc}%", ha='right', va='center', fontsize=8, bbox=dict(facecolor='white', edgecolor='none', pad=0.2))
+        _draw_reference_rings(ax, perc_levels, show_to_perc)
         for ang in (0.0, np.pi/2, np.pi, 3*np.pi/2):
             ax.plot([ang, ang], [0, r_edge], color='k', lw=0.5)
         theta_sig = np.deg2rad(theta_sigma1)
@@ -2637,10 +2872,13 @@ class MainWindow(QtW.QMainWindow):
             pass
         title_above_axes(ax, r'Segment angles (equal area), colour-coded by $S_f$', offset_points=24, top=0.96, adjust_layout=False)
 
+    def _on_map_check_toggled(self, on: bool) -> None:
+        self._map_checks_on += 1 if on else -1
+        self._update_run_enabled()
+
     def _update_run_enabled(self) -> None:
         # Enable Run if any checkbox in tabs is checked and data is loaded
         if not hasattr(self, "btn_run"):
             return
-        checks = self.tab_maps.findChildren(QtW.QCheckBox)
-        any_checked = any(cb.isChecked() for cb in checks)
-        self.btn_run.setEnabled(bool(getattr(self, "_segments", [])) and any_checked)
+        any_checked = getattr(self, "_map_checks_on", 0) > 0
+        self.btn_run.setEnabled(bool(self._seg_xy.shape[0]) and any_checked)
@@ -17,6 +17,9 @@ def prepare_figure_layout(fig: Figure) -> None:
     Avoids warnings and clipping when using axes_grid1 for axis-wide colorbars
     and when tightening title/top margins programmatically.
     """
+    if fig.get_layout_engine() is None:
+        # Already manual (plot windows are created without an engine)
+        return
     try:
         fig.set_constrained_layout(False)
     except Exception:
@@ -67,12 +70,17 @@ def axis_wide_colorbar(
         divider = make_axes_locatable(ax)
         cax = divider.append_axes(location, size=size, pad=pad)
 
-    # Remove any existing colorbar axes with the same gid (avoid duplicates)
+    # Remove any existing colorbar axes with the same gid (avoid duplicates);
+    # looked up in the figure's gid registry instead of scanning fig.axes
     if gid:
-        for ax2 in list(fig.axes):
+        registry = getattr(fig, '_colorbar_axes_by_gid', None)
+        if registry is None:
+            registry = fig._colorbar_axes_by_gid = {}
+        old_ref = registry.pop(gid, None)
+        old = old_ref() if old_ref is not None else None
+        if old is not None and old in fig.axes:
             try:
-                if getattr(ax2, 'get_gid', lambda: None)() == gid:
-                    ax2.remove()
+                old.remove()
             except Exception:
                 pass
     # When boundaries are provided, use them to create a discrete colorbar and draw edges
@@ -106,6 +114,7 @@ def axis_wide_colorbar(
     try:
         if gid:
             cbar.ax.set_gid(gid)
+            fig._colorbar_axes_by_gid[gid] = weakref.ref(cbar.ax)
     except Exception:
         pass
     if is_polar:
@@ -121,9 +130,13 @@ def _normalize_fraction_arg(
     assume_percent_if_gt1: bool = True,
 ) -> float:
     """Convert numeric/percent inputs to a 0..1 fraction."""
-    result = float(default)
-    if value is None:
-        pass
+    if isinstance(value, float):
+        # Common case (plain number): no string probing or exception guard
+        result = float(value)
+        if assume_percent_if_gt1 and result > 1.0:
+            result = result / 100.0
+    elif value is None:
+        result = float(default)
     else:
         try:
             if isinstance(value, str):
@@ -207,22 +220,31 @@ def _entry_alive(entry: dict) -> bool:
 
 
 def _apply_polar_colorbar_entry(entry: dict) -> bool:
+    """Move the entry's colorbar under its axes; True only if its position changed."""
     if not _entry_alive(entry):
         return False
     ax = entry['ax']()
     cax = entry['cax']()
     pos = _compute_polar_colorbar_box(ax, frac=entry['frac'], pad_frac=entry['pad_frac'], location=entry['location'])
+    # Unchanged geometry: skip set_position, which would mark the figure stale
+    cur = cax.get_position(original=True).bounds
+    if all(abs(a - b) < 1e-9 for a, b in zip(pos, cur)):
+        return False
     cax.set_position(pos)
     return True
 
 
-def _update_polar_colorbars(fig: Figure) -> None:
+def _update_polar_colorbars(fig: Figure) -> bool:
+    """Reposition the figure's live polar colorbars; True if any of them moved."""
     registry = getattr(fig, '_polar_colorbar_registry', [])
     alive = []
+    moved = False
     for entry in registry:
-        if _apply_polar_colorbar_entry(entry):
+        if _entry_alive(entry):
             alive.append(entry)
+            moved = _apply_polar_colorbar_entry(entry) or moved
     fig._polar_colorbar_registry = alive
+    return moved
 
 
 def _ensure_polar_colorbar_callbacks(fig: Figure) -> None:
@@ -234,7 +256,11 @@ def _ensure_polar_colorbar_callbacks(fig: Figure) -> None:
     def _refresh(event):
         if event is not None and getattr(event, 'canvas', None) is not canvas:
             return
-        _update_polar_colorbars(fig)
+        moved = _update_polar_colorbars(fig)
+        # A draw that just moved a colorbar rendered it at the old place: schedule one
+        # more (the next pass finds the geometry unchanged, so this does not repeat)
+        if moved and getattr(event, 'name', None) == 'draw_event':
+            canvas.draw_idle()
     cid_resize = canvas.mpl_connect('resize_event', _refresh)
     cid_draw = canvas.mpl_connect('draw_event', _refresh)
     canvas._polar_colorbar_cids = (cid_resize, cid_draw)
@@ -251,13 +277,11 @@ def _register_polar_colorbar(ax: Axes, cax: Axes, *, frac: float, pad_frac: floa
         'pad_frac': float(max(pad_frac, 0.0)),
         'location': location,
     }
-    _apply_polar_colorbar_entry(entry)
-    registry = []
-    for existing in getattr(fig, '_polar_colorbar_registry', []):
-        if _apply_polar_colorbar_entry(existing):
-            registry.append(existing)
+    # Only drop dead entries here: live ones are repositioned on resize/draw
+    registry = [e for e in getattr(fig, '_polar_colorbar_registry', []) if _entry_alive(e)]
     registry.append(entry)
     fig._polar_colorbar_registry = registry
+    _apply_polar_colorbar_entry(entry)
     _ensure_polar_colorbar_callbacks(fig)
 
 
@@ -271,19 +295,18 @@ def center_title_over_axes(
 ):
     """Place a suptitle visually centered over the axes and reserve top space."""
     prepare_figure_layout(fig)
-    # Remove any existing suptitle explicitly to avoid duplicates on redraw/reuse
-    try:
-        prev = getattr(fig, "_suptitle", None)
-        if prev is not None:
-            try:
-                prev.remove()
-            except Exception:
-                pass
-    except Exception:
-        pass
     bbox = ax.get_position()
     x_center = (bbox.x0 + bbox.x1) / 2.0
-    fig.suptitle(text, y=y, x=x_center, ha="center")
+    # Update an existing suptitle in place (no duplicate, no new Text artist)
+    prev = getattr(fig, "_suptitle", None)
+    if prev is not None:
+        if prev.get_text() != text:
+            prev.set_text(text)
+        if prev.get_position() != (x_center, y):
+            prev.set_position((x_center, y))
+        prev.set_horizontalalignment("center")
+    else:
+        fig.suptitle(text, y=y, x=x_center, ha="center")
     try:
         fig.subplots_adjust(top=top)
     except Exception:
@@ -314,7 +337,14 @@ def title_above_axes(
     if fontsize is None:
         # Match typical axes title size for consistency
         fontsize = rcParams.get('axes.titlesize', rcParams.get('font.size', 10))
-    ax.annotate(
+    # Re-titling the same axes updates its annotation instead of stacking a new one
+    artist = getattr(ax, "_title_above_artist", None)
+    if artist is not None and artist in ax.texts:
+        artist.set_text(text)
+        artist.set_fontsize(fontsize)
+        artist.xyann = (0, offset_points)
+        return
+    ax._title_above_artist = ax.annotate(
         text,
         xy=(0.5, 1.0),
         xycoords="axes fraction",
@@ -346,7 +376,7 @@ def reserve_axes_margins(ax: Axes, *, top: float = 0.06, bottom: float = 0.10) -
     # Keep at least 10% of original height
     min_h = max(0.1 * bbox.height, 0.05)
     new_h = max(new_top - new_y0, min_h)
-    ax.set_position([bbox.x0, new_y0, bbox.width, new_h])
+    _set_position_if_changed(ax, [bbox.x0, new_y0, bbox.width, new_h])
     try:
         ax._shrink_base_bounds = tuple(ax.get_position().bounds)
     except Exception:
@@ -376,4 +406,16 @@ def shrink_axes_vertical(ax: Axes, *, factor: float = 0.9) -> None:
         new_y0 = 0.02
     if new_y0 + new_h > 0.98:
         new_y0 = 0.98 - new_h
-    ax.set_position([x0, new_y0, width, new_h])
+    _set_position_if_changed(ax, [x0, new_y0, width, new_h])
+
+
+def _set_position_if_changed(ax: Axes, bounds) -> None:
+    """``ax.set_position(bounds)``, skipped when the axes is already there.
+
+    set_position invalidates the axes transforms and marks the figure stale
+    even when the box does not move.
+    """
+    cur = ax.get_position(original=True).bounds
+    if all(abs(a - b) < 1e-9 for a, b in zip(bounds, cur)):
+        return
+    ax.set_position(bounds)
@@ -1,13 +1,18 @@
 from __future__ import annotations
 
 from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
+from matplotlib.colors import to_rgba
 from matplotlib.figure import Figure
-from PySide6 import QtCore, QtGui
+from PySide6 import QtCore, QtGui, QtWidgets
 
 
 class MplCanvas(FigureCanvas):
-    def __init__(self, width: float = 5, height: float = 4, dpi: int = 100, polar: bool = False):
-        self.figure = Figure(figsize=(width, height), dpi=dpi)
+    def __init__(self, width: float = 5, height: float = 4, dpi: int = 100, polar: bool = False,
+                 constrained: bool = True):
+        # Layout engine is chosen once here: canvases whose plots place colorbars
+        # and titles manually pass constrained=False instead of switching it off later
+        self.figure = Figure(figsize=(width, height), dpi=dpi,
+                             layout="constrained" if constrained else None)
         if polar:
             self.ax = self.figure.add_subplot(111, projection="polar")
         else:
@@ -20,13 +25,137 @@ class MplCanvas(FigureCanvas):
             self.ax.set_facecolor("white")
         except Exception:
             pass
-        # Improve autosizing of the axes within the available canvas area
+        # Hint Qt that we paint opaquely to reduce edge artifacts
+        self.setAttribute(QtCore.Qt.WA_OpaquePaintEvent, True)
+        # Blitting: animated overlay artists are redrawn over a cached background
+        self._blit_bg = None
+        self._blit_artists = []
+        self.mpl_connect("draw_event", self._on_draw_event)
+        # Redraw rate limiter for queue_redraw (bursty inputs such as rapid clicks)
+        self._redraw_pending = False
+        self._redraw_timer = QtCore.QTimer(self)
+        self._redraw_timer.setSingleShot(True)
+        self._redraw_timer.timeout.connect(self._on_redraw_timer)
+        self.set_max_redraw_rate(30.0)
+
+    def set_max_redraw_rate(self, hz: float) -> None:
+        """Limit redraws requested through :meth:`queue_redraw` to ``hz`` per second."""
+        self._redraw_timer.setInterval(max(1, int(round(1000.0 / hz))))
+
+    def queue_redraw(self) -> None:
+        """Request a redraw, at most once per rate-limit interval.
+
+        The first request draws at once (via ``draw_idle``); further requests
+        within the interval collapse into a single draw when it ends.
+        """
+        if self._redraw_timer.isActive():
+            self._redraw_pending = True
+            return
+        self.draw_idle()
+        self._redraw_timer.start()
+
+    def _on_redraw_timer(self) -> None:
+        if self._redraw_pending:
+            self._redraw_pending = False
+            self.draw_idle()
+            self._redraw_timer.start()
+
+    def resizeEvent(self, event) -> None:
+        # Agg keeps its renderer while the pixel size is unchanged; layout passes
+        # that re-send the same size need neither a new buffer nor a redraw
+        if event.size() == event.oldSize() and getattr(self, "renderer", None) is not None:
+            QtWidgets.QWidget.resizeEvent(self, event)
+            return
+        super().resizeEvent(event)
+
+    def paintEvent(self, event) -> None:
+        """Paint the whole Agg buffer straight into the widget when possible.
+
+        The base implementation copies the dirty region out of the renderer
+        (``copy_from_bbox``) and erases the widget first. For full-widget
+        repaints of an opaque canvas the renderer buffer can be wrapped
+        directly, with no copy and no erase; partial repaints and size
+        mismatches (e.g. mid-resize) use the base implementation.
+        """
+        self._draw_idle()  # Only does something if a draw is pending
+        renderer = getattr(self, "renderer", None)
+        if renderer is None:
+            return
+        buf = memoryview(renderer.buffer_rgba())
+        dpr = self.device_pixel_ratio
+        if (event.rect() != self.rect()
+                or buf.shape[1] != round(self.width() * dpr)
+                or buf.shape[0] != round(self.height() * dpr)):
+            super().paintEvent(event)
+            return
+        painter = QtGui.QPainter(self)
+        try:
+            qimage = QtGui.QImage(buf, buf.shape[1], buf.shape[0], QtGui.QImage.Format.Format_RGBA8888)
+            qimage.setDevicePixelRatio(dpr)
+            painter.drawImage(QtCore.QPoint(0, 0), qimage)
+            self._draw_rect_callback(painter)
+        finally:
+            painter.end()
+
+    def set_blit_artists(self, artists) -> None:
+        """Register overlay artists that are updated by blitting.
+
+        They are marked animated, so full screen draws skip them (``savefig``
+        still renders them); they are painted on top of the cached background
+        after every screen draw and by :meth:`blit_artists`.
+        """
+        for a in self._blit_artists:
+            a.set_animated(False)
+        self._blit_artists = list(artists)
+        for a in self._blit_artists:
+            a.set_animated(True)
+        self._blit_bg = None
+
+    def _draw_blit_artists(self) -> None:
+        for a in self._blit_artists:
+            if a.get_visible() and a.figure is self.figure:
+                self.figure.draw_artist(a)
+
+    def _on_draw_event(self, event) -> None:
+        # savefig draws (possibly on a temporary vector canvas) already include
+        # the animated overlays; only screen draws need them composited
+        if self.is_saving() or self.figure.canvas is not self:
+            return
+        # Cache the background (without overlays) after each full draw
+        self._blit_bg = self.copy_from_bbox(self.figure.bbox)
+        self._draw_blit_artists()
+
+    def blit_artists(self) -> None:
+        """Repaint only the registered overlay artists over the cached background."""
+        if self._blit_bg is None:
+            self.draw_idle()
+            return
+        self.restore_region(self._blit_bg)
+        self._draw_blit_artists()
+        self.blit(self.figure.bbox)
+
+    def _set_background(self, rgb, axis_on: bool) -> None:
+        """Apply figure/axes colour and axis visibility; redraw only if something changed.
+
+        ``draw_idle`` already coalesces requests within one event-loop turn;
+        this additionally skips the request when the state is unchanged
+        (e.g. repeated replots that keep the white background).
+        """
+        rgba = to_rgba(rgb)
+        ax = self.ax
+        if (
+            to_rgba(self.figure.get_facecolor()) == rgba
+            and to_rgba(ax.get_facecolor()) == rgba
+            and bool(ax.axison) == axis_on
+        ):
+            return
+        self.figure.set_facecolor(rgba)
         try:
-            self.figure.set_constrained_layout(True)
+            ax.set_facecolor(rgba)
         except Exception:
             pass
-        # Hint Qt that we paint opaquely to reduce edge artifacts
-        self.setAttribute(QtCore.Qt.WA_OpaquePaintEvent, True)
+        ax.axis('on' if axis_on else 'off')
+        self.draw_idle()
 
     def set_placeholder_background(self, color: QtGui.QColor) -> None:
         """Set a neutral background and hide axes for placeholder state.
@@ -35,21 +164,11 @@ class MplCanvas(FigureCanvas):
         """
         try:
             rgb = (color.redF(), color.greenF(), color.blueF())
-            self.figure.set_facecolor(rgb)
-            self.ax.set_facecolor(rgb)
         except Exception:
             # Fallback to a light gray if no QColor provided
-            self.figure.set_facecolor((0.9, 0.9, 0.9))
-            self.ax.set_facecolor((0.9, 0.9, 0.9))
-        self.ax.axis('off')
-        self.draw_idle()
+            rgb = (0.9, 0.9, 0.9)
+        self._set_background(rgb, axis_on=False)
 
     def set_plot_background_white(self) -> None:
         """Set a white plot background and show axes for plotted state."""
-        self.figure.set_facecolor("white")
-        try:
-            self.ax.set_facecolor("white")
-        except Exception:
-            pass
-        self.ax.axis('on')
-        self.draw_idle()
+        self._set_background("white", axis_on=True)
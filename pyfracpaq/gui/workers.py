@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import List, NamedTuple
+
+import numpy as np
+from PySide6 import QtCore
+
+from ..io import read_traces_txt
+from ..types import Trace
+
+
+class LoadedTraces(NamedTuple):
+    """Traces plus the packed arrays the GUI plots and measures from."""
+
+    traces: List[Trace]
+    # Segments per trace
+    seg_counts: np.ndarray
+    # All segments as an (N, 4) x1 y1 x2 y2 array, in trace order
+    seg_xy: np.ndarray
+
+
+def pack_traces(traces: List[Trace]) -> LoadedTraces:
+    """Flatten the traces' segments into an ``(N, 4)`` array (one pass, no lists)."""
+    seg_counts = np.fromiter((len(t.segments) for t in traces), dtype=np.int64, count=len(traces))
+    seg_xy = np.fromiter(
+        (v for t in traces for s in t.segments for v in (s.x1, s.y1, s.x2, s.y2)),
+        dtype=np.float64,
+        count=4 * int(seg_counts.sum()),
+    ).reshape(-1, 4)
+    return LoadedTraces(traces, seg_counts, seg_xy)
+
+
+class TraceLoaderSignals(QtCore.QObject):
+    # (path, LoadedTraces, error): the result is None when reading failed
+    finished = QtCore.Signal(object, object, object)
+
+
+class TraceLoader(QtCore.QRunnable):
+    """Parse a traces file and pack its segments on a pool thread.
+
+    The result is delivered through a queued signal, so the slot runs on the
+    GUI thread and only has to assign the arrays.
+    """
+
+    def __init__(self, path: Path) -> None:
+        super().__init__()
+        self.path = path
+        self.signals = TraceLoaderSignals()
+
+    def run(self) -> None:
+        try:
+            loaded = pack_traces(read_traces_txt(self.path))
+        except Exception as e:
+            self.signals.finished.emit(self.path, None, e)
+            return
+        self.signals.finished.emit(self.path, loaded, None)
@@ -1,3 +1,3 @@
-from .txt import read_segments_txt, read_traces_txt
+from .txt import read_segments_array, read_segments_txt, read_traces_txt
 
-__all__ = ["read_segments_txt", "read_traces_txt"]
+__all__ = ["read_segments_array", "read_segments_txt", "read_traces_txt"]
@@ -1,42 +1,211 @@
 from __future__ import annotations
 
+import io
+import warnings
+from itertools import islice
 from pathlib import Path
-from typing import Iterable, List, Tuple
+from typing import Iterable, List, Optional, Tuple
+
+import numpy as np
 
 from ..types import Segment, Trace
 
 
+def _parse_segment_line(ln: str) -> Optional[Tuple[float, float, float, float]]:
+    """Parse one ``x1 y1 x2 y2`` line; return None for blank/comment/malformed lines."""
+    line = ln.strip()
+    if not line or line.startswith("#"):
+        return None
+    # Support comma or whitespace delimiters
+    parts: List[str]
+    if "," in line:
+        parts = [x.strip() for x in line.split(",") if x.strip()]
+    else:
+        parts = line.split()
+    if len(parts) < 4:
+        # Skip malformed lines silently; could also raise ValueError
+        return None
+    try:
+        x1, y1, x2, y2 = map(float, parts[:4])
+    except ValueError:
+        return None
+    return (x1, y1, x2, y2)
+
+
 def read_segments_txt(path: str | Path) -> List[Segment]:
     """Read segments from a whitespace- or comma-separated text file.
 
     Expected columns per line (at minimum): x1 y1 x2 y2
     Extra columns are ignored. Blank lines and lines starting with '#' are skipped.
+    The text is parsed in bulk as in :func:`read_segments_array`; callers that
+    do not need ``Segment`` objects should use that function instead.
     """
     p = Path(path)
     if not p.exists():
         raise FileNotFoundError(p)
 
-    segments: List[Segment] = []
-    with p.open("r", encoding="utf-8") as f:
-        for ln in f:
-            line = ln.strip()
-            if not line or line.startswith("#"):
-                continue
-            # Support comma or whitespace delimiters
-            parts: List[str]
-            if "," in line:
-                parts = [x.strip() for x in line.split(",") if x.strip()]
-            else:
-                parts = line.split()
-            if len(parts) < 4:
-                # Skip malformed lines silently; could also raise ValueError
-                continue
-            try:
-                x1, y1, x2, y2 = map(float, parts[:4])
-            except ValueError:
+    return Segment._from_rows(_parse_segments_text(p.read_text(encoding="utf-8")).tolist())
+
+
+def read_segments_array(
+    path: str | Path,
+    cache: bool = False,
+    dtype: np.dtype | type = np.float64,
+) -> np.ndarray:
+    """Read segments from a text file into an ``(N, 4)`` float array.
+
+    Same format as :func:`read_segments_txt`, but returns one
+    ``x1 y1 x2 y2`` row per segment instead of ``Segment`` objects. Files
+    are parsed in bulk with ``np.loadtxt``; if any line is malformed the
+    tolerant line-by-line parser is used instead, skipping such lines.
+
+    The array is column-major (Fortran order): each of ``x1, y1, x2, y2`` is
+    a contiguous column, so ``xy[:, 2] - xy[:, 0]`` runs over dense memory.
+    ``dtype=np.float32`` halves memory for very large maps.
+
+    With ``cache=True`` the parsed array is stored next to the input as
+    ``<name>.npy`` and memory-mapped (read-only) on later calls, as long as
+    the sidecar is not older than the text file.
+    """
+    p = Path(path)
+    if not p.exists():
+        raise FileNotFoundError(p)
+
+    sidecar = p.with_name(p.name + ".npy")
+    if cache:
+        try:
+            if sidecar.stat().st_mtime >= p.stat().st_mtime:
+                arr = np.load(sidecar, mmap_mode="r")
+                if arr.dtype == dtype and arr.flags.f_contiguous:
+                    return arr
+                return np.asfortranarray(arr, dtype=dtype)
+        except (OSError, ValueError):
+            pass
+
+    arr = np.asfortranarray(_parse_segments_text(p.read_text(encoding="utf-8")), dtype=dtype)
+    if cache:
+        try:
+            np.save(sidecar, arr)
+        except OSError:
+            # Read-only location: caching is best effort
+            pass
+    return arr
+
+
+def _parse_segments_text(text: str) -> np.ndarray:
+    """Parse segment text into an ``(N, 4)`` array (bulk, with tolerant fallback)."""
+    delimiter = "," if "," in text else None
+    try:
+        with warnings.catch_warnings():
+            # An empty (or comment-only) file is not an error here
+            warnings.simplefilter("ignore", UserWarning)
+            arr = np.loadtxt(
+                io.StringIO(text),
+                dtype=float,
+                comments="#",
+                delimiter=delimiter,
+                usecols=(0, 1, 2, 3),
+                ndmin=2,
+            )
+    except ValueError:
+        rows = [r for r in map(_parse_segment_line, text.splitlines()) if r is not None]
+        arr = np.array(rows, dtype=float)
+    return arr.reshape(-1, 4)
+
+
+def _trace_tokens(ln: str) -> Optional[List[str]]:
+    """Split one polyline line into value tokens; None for blank/comment lines."""
+    line = ln.strip()
+    if not line or line.startswith("#"):
+        return None
+    # Allow comma or whitespace-delimited values
+    if "," in line:
+        return [x.strip() for x in line.split(",") if x.strip()]
+    return line.split()
+
+
+def _trace_points(parts: List[str]) -> List[Tuple[float, float]]:
+    """Leading numeric tokens as (x, y) points; fewer than two points -> empty."""
+    # Keep only numeric convertible tokens
+    vals: List[float] = []
+    for t in parts:
+        try:
+            vals.append(float(t))
+        except ValueError:
+            # stop at first non-numeric
+            break
+    if len(vals) < 4:
+        return []
+    # Ensure even number of coordinates (pairs of x,y)
+    if len(vals) % 2 == 1:
+        vals = vals[:-1]
+    return [(vals[i], vals[i + 1]) for i in range(0, len(vals), 2)]
+
+
+def _parse_traces_lines(lines: List[List[str]]) -> Tuple[np.ndarray, np.ndarray]:
+    """Line-by-line parser behind :func:`_parse_traces_text` (tolerant, slower)."""
+    rows: List[Tuple[float, float, float, float]] = []
+    counts: List[int] = []
+    for parts in lines:
+        pts = _trace_points(parts)
+        if len(pts) < 2:
+            continue
+        n0 = len(rows)
+        prev = pts[0]
+        for cur in pts[1:]:
+            if cur == prev:
                 continue
-            segments.append(Segment(x1, y1, x2, y2))
-    return segments
+            rows.append((prev[0], prev[1], cur[0], cur[1]))
+            prev = cur
+        if len(rows) > n0:
+            counts.append(len(rows) - n0)
+    return np.array(rows, dtype=np.float64).reshape(-1, 4), np.array(counts, dtype=np.int64)
+
+
+def _parse_traces_text(text: str) -> Tuple[np.ndarray, np.ndarray]:
+    """Parse polyline text into ``(seg_xy, seg_counts)``.
+
+    ``seg_xy`` holds every segment as an ``(N, 4)`` ``x1 y1 x2 y2`` row, trace
+    after trace; ``seg_counts`` the number of segments of each trace. When
+    every token is numeric all values are converted in one ``np.fromstring``
+    call and the polylines are split and de-duplicated with array operations;
+    otherwise each line is parsed on its own, stopping at its first
+    non-numeric token.
+    """
+    lines = [parts for parts in map(_trace_tokens, text.splitlines()) if parts is not None]
+    tokens = [t for parts in lines for t in parts]
+    joined = " ".join(tokens)
+    vals = None
+    # A token holding whitespace would shift every later line: parse per line then
+    if len(joined.split()) == len(tokens):
+        try:
+            with warnings.catch_warnings():
+                # Older NumPy warns (instead of raising) on unparsable text
+                warnings.simplefilter("ignore", DeprecationWarning)
+                vals = np.fromstring(joined, dtype=np.float64, sep=" ")
+        except ValueError:
+            vals = None
+    if vals is None or vals.size != len(tokens):
+        return _parse_traces_lines(lines)
+
+    ntok = np.fromiter(map(len, lines), dtype=np.int64, count=len(lines))
+    # Lines need two points; an odd trailing value is dropped
+    npts = np.where(ntok >= 4, ntok // 2, 0)
+    first = np.cumsum(ntok) - ntok
+    line_of_val = np.repeat(np.arange(len(lines)), ntok)
+    used = (np.arange(vals.size) - first[line_of_val]) < 2 * npts[line_of_val]
+    pts = vals[used].reshape(-1, 2)
+    line_of_pt = np.repeat(np.arange(len(lines)), npts)
+    # Drop points repeating the previous point of the same line
+    keep = np.ones(pts.shape[0], dtype=bool)
+    keep[1:] = (line_of_pt[1:] != line_of_pt[:-1]) | np.any(pts[1:] != pts[:-1], axis=1)
+    pts = pts[keep]
+    line_of_pt = line_of_pt[keep]
+    # Consecutive points of the same line form a segment
+    same = line_of_pt[1:] == line_of_pt[:-1]
+    seg_xy = np.hstack((pts[:-1][same], pts[1:][same]))
+    seg_counts = np.bincount(line_of_pt[:-1][same], minlength=len(lines))
+    return seg_xy.reshape(-1, 4), seg_counts[seg_counts > 0].astype(np.int64)
 
 
 def read_traces_txt(path: str | Path) -> List[Trace]:
@@ -52,40 +221,7 @@ def read_traces_txt(path: str | Path) -> List[Trace]:
     if not p.exists():
         raise FileNotFoundError(p)
 
-    traces: List[Trace] = []
-    with p.open("r", encoding="utf-8") as f:
-        for ln in f:
-            line = ln.strip()
-            if not line or line.startswith("#"):
-                continue
-            # Allow comma or whitespace-delimited values
-            if "," in line:
-                parts = [x.strip() for x in line.split(",") if x.strip()]
-            else:
-                parts = line.split()
-            # Keep only numeric convertible tokens
-            vals: List[float] = []
-            for t in parts:
-                try:
-                    vals.append(float(t))
-                except ValueError:
-                    # stop at first non-numeric
-                    break
-            if len(vals) < 4:
-                continue
-            # Ensure even number of coordinates (pairs of x,y)
-            if len(vals) % 2 == 1:
-                vals = vals[:-1]
-            pts: List[Tuple[float, float]] = [(vals[i], vals[i + 1]) for i in range(0, len(vals), 2)]
-            if len(pts) < 2:
-                continue
-            segs: List[Segment] = []
-            prev = pts[0]
-            for cur in pts[1:]:
-                if cur == prev:
-                    continue
-                segs.append(Segment(prev[0], prev[1], cur[0], cur[1]))
-                prev = cur
-            if segs:
-                traces.append(Trace(segs))
-    return traces
+    # One bulk read, then split and convert in memory (no per-line buffered I/O)
+    seg_xy, seg_counts = _parse_traces_text(p.read_bytes().decode("utf-8"))
+    segs = iter(Segment._from_rows(seg_xy.tolist()))
+    return [Trace(list(islice(segs, n))) for n in seg_counts.tolist()]
@@ -1,8 +1,11 @@
-from .tracemap import plot_tracemap
-from .rose import plot_rose
+from .tracemap import plot_tracemap, update_tracemap
+from .rose import plot_rose, plot_rose_hist, plot_rose_segments
 
 __all__ = [
     "plot_tracemap",
+    "update_tracemap",
     "plot_rose",
+    "plot_rose_hist",
+    "plot_rose_segments",
 ]
 
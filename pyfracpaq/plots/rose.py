@@ -1,12 +1,14 @@
 from __future__ import annotations
 
-from typing import Optional
-
-import matplotlib.pyplot as plt
+from typing import TYPE_CHECKING, Optional
 
 import numpy as np
 
-from ..stats.orientation import rose_hist
+from ..stats.orientation import rose_hist, rose_hist_segments
+from ..types import SegmentsLike
+
+if TYPE_CHECKING:
+    import matplotlib.pyplot as plt
 
 
 def plot_rose(
@@ -20,10 +22,46 @@ def plot_rose(
 ) -> plt.Axes:
     """Plot a rose diagram from orientation angles (degrees)."""
     theta, radii = rose_hist(angles_deg, bins=bins, bidirectional=bidirectional)
+    return plot_rose_hist(theta, radii, ax=ax, facecolor=facecolor, edgecolor=edgecolor, alpha=alpha)
+
+
+def plot_rose_segments(
+    segments: SegmentsLike,
+    bins: int = 18,
+    ax: Optional[plt.Axes] = None,
+    facecolor: str = "C0",
+    edgecolor: str = "white",
+    alpha: float = 0.9,
+) -> plt.Axes:
+    """Plot a bidirectional rose diagram directly from segments (no angle array)."""
+    theta, radii = rose_hist_segments(segments, bins=bins)
+    return plot_rose_hist(theta, radii, ax=ax, facecolor=facecolor, edgecolor=edgecolor, alpha=alpha)
+
+
+def plot_rose_hist(
+    theta: np.ndarray,
+    radii: np.ndarray,
+    ax: Optional[plt.Axes] = None,
+    facecolor: str = "C0",
+    edgecolor: str = "white",
+    alpha: float = 0.9,
+) -> plt.Axes:
+    """Plot a rose diagram from a precomputed histogram (e.g. from ``rose_hist``).
+
+    ``theta`` are bin centers in radians over 0..2π and ``radii`` the counts;
+    all non-empty wedges are drawn with a single ``bar`` call (empty bins
+    would only add zero-height patches to draw and hit-test).
+    """
     if ax is None:
+        # pyplot only when a new figure is needed (keeps embedding callers light)
+        import matplotlib.pyplot as plt
+
         fig, ax = plt.subplots(subplot_kw={"projection": "polar"}, figsize=(6, 6))
-    width = 2 * np.pi / bins
-    bars = ax.bar(theta, radii, width=width, bottom=0.0, align="center",
+    theta = np.asarray(theta)
+    radii = np.asarray(radii)
+    width = 2 * np.pi / max(len(theta), 1)
+    nonzero = radii > 0
+    bars = ax.bar(theta[nonzero], radii[nonzero], width=width, bottom=0.0, align="center",
                   facecolor=facecolor, edgecolor=edgecolor, alpha=alpha)
     ax.set_theta_zero_location("E")  # 0° to the right
     ax.set_theta_direction(-1)        # clockwise
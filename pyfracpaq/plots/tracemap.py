@@ -1,14 +1,57 @@
 from __future__ import annotations
 
-from typing import Iterable, Optional
+from typing import TYPE_CHECKING, Optional
 
-import matplotlib.pyplot as plt
+import numpy as np
+from matplotlib.collections import LineCollection
+from matplotlib.colors import to_rgba
 
-from ..types import Segment
+from ..types import SegmentsLike, as_segment_array
+
+if TYPE_CHECKING:
+    import matplotlib.pyplot as plt
+
+# Below this many segments level-of-detail filtering costs more than it saves
+LOD_MIN_SEGMENTS = 50_000
+
+
+class _LODLineCollection(LineCollection):
+    """LineCollection that draws at most one segment per pair of screen pixels.
+
+    Endpoints are snapped to the device pixel grid at draw time and segments
+    landing on the same pixel pair are drawn once, so render cost follows the
+    visible detail instead of N. When zoomed in, segments whose bounding box
+    lies outside the axes are dropped as well. The filtered set is rebuilt
+    only when the data-to-display transform changes (pan, zoom, resize, dpi).
+    """
+
+    def __init__(self, xy: np.ndarray, **kwargs):
+        super().__init__(xy.reshape(-1, 2, 2), **kwargs)
+        self._lod_xy = xy
+        self._lod_key = None
+
+    def draw(self, renderer):
+        if self.axes is not None and self.get_visible():
+            key = self.axes.transData.get_matrix().tobytes()
+            if key != self._lod_key:
+                self._lod_key = key
+                px = np.floor(self.axes.transData.transform(self._lod_xy.reshape(-1, 2))).reshape(-1, 4)
+                # View culling, with a pixel of slack for line width
+                bb = self.axes.bbox
+                sx = px[:, 0::2]
+                sy = px[:, 1::2]
+                vis = np.flatnonzero(
+                    (sx.max(axis=1) >= bb.x0 - 2) & (sx.min(axis=1) <= bb.x1 + 1)
+                    & (sy.max(axis=1) >= bb.y0 - 2) & (sy.min(axis=1) <= bb.y1 + 1)
+                )
+                _, keep = np.unique(px[vis], axis=0, return_index=True)
+                keep = vis[np.sort(keep)]
+                self.set_segments(self._lod_xy[keep].reshape(-1, 2, 2))
+        super().draw(renderer)
 
 
 def plot_tracemap(
-    segments: Iterable[Segment],
+    segments: SegmentsLike,
     ax: Optional[plt.Axes] = None,
     color: str = "b",
     linewidth: float = 0.75,
@@ -16,22 +59,59 @@ def plot_tracemap(
     show_nodes: bool = False,
     node_color: str = "k",
     node_size: float = 5.0,
+    rasterized: bool = False,
+    lod: bool = False,
 ) -> plt.Axes:
-    """Plot a simple trace map from segments."""
+    """Plot a simple trace map from segments (``Segment`` objects or an ``(N, 4)`` array).
+
+    ``rasterized=True`` embeds the traces as an image in vector outputs
+    (PDF/SVG), which keeps very large maps small and fast to write.
+    ``lod=True`` skips segments that fall on an already drawn pair of screen
+    pixels (maps with at least ``LOD_MIN_SEGMENTS`` segments only).
+    """
     if ax is None:
+        # pyplot only when a new figure is needed (keeps embedding callers light)
+        import matplotlib.pyplot as plt
+
         fig, ax = plt.subplots(figsize=(6, 6))
-    for s in segments:
-        ax.plot([s.x1, s.x2], [s.y1, s.y2], color=color, lw=linewidth)
+    xy = as_segment_array(segments)
+    if xy.shape[0]:
+        # One collection for all segments instead of one Line2D per segment,
+        # with the cap/join styles ``ax.plot`` lines get by default
+        kwargs = dict(colors=[to_rgba(color)], linewidths=linewidth, rasterized=rasterized,
+                      capstyle="projecting", joinstyle="round")
+        if lod and xy.shape[0] >= LOD_MIN_SEGMENTS:
+            lc = _LODLineCollection(xy, **kwargs)
+        else:
+            lc = LineCollection(xy.reshape(-1, 2, 2), **kwargs)
+        ax.add_collection(lc, autolim=True)
+        ax.autoscale_view()
     if show_nodes:
-        xs = []
-        ys = []
-        for s in segments:
-            xs.extend([s.x1, s.x2])
-            ys.extend([s.y1, s.y2])
-        ax.scatter(xs, ys, s=node_size, c=node_color, marker='o', alpha=0.7, linewidths=0)
+        # (2N, 2) endpoint pairs; a view for C-ordered input
+        pts = xy.reshape(-1, 2)
+        ax.scatter(pts[:, 0], pts[:, 1], s=node_size, c=node_color, marker='o', alpha=0.7, linewidths=0)
     if equal_aspect:
         ax.set_aspect("equal", adjustable="box")
     ax.set_xlabel("X, pixels")
     ax.set_ylabel("Y, pixels")
     ax.set_title("")
     return ax
+
+
+def update_tracemap(lc: LineCollection, segments: SegmentsLike, lod: bool = False) -> bool:
+    """Replace the segments of a collection made by :func:`plot_tracemap` in place.
+
+    Keeps the artist (and the axes around it) alive instead of clearing and
+    re-plotting. Data limits are not touched. Returns False, leaving ``lc``
+    unchanged, when the new data needs the other collection kind (level of
+    detail on/off); the caller should then plot afresh.
+    """
+    xy = as_segment_array(segments)
+    want_lod = lod and xy.shape[0] >= LOD_MIN_SEGMENTS
+    if want_lod != isinstance(lc, _LODLineCollection):
+        return False
+    if want_lod:
+        lc._lod_xy = xy
+        lc._lod_key = None
+    lc.set_segments(xy.reshape(-1, 2, 2))
+    return True
@@ -1,9 +1,13 @@
-from .orientation import orientations_deg, rose_hist
-from .lengths import lengths
+from .orientation import orientations_deg, rose_hist, rose_hist_segments
+from .lengths import lengths, lengths_and_orientations
+from .stress import slip_stresses
 
 __all__ = [
     "orientations_deg",
     "rose_hist",
+    "rose_hist_segments",
     "lengths",
+    "lengths_and_orientations",
+    "slip_stresses",
 ]
 
@@ -1,13 +1,35 @@
 from __future__ import annotations
 
-from typing import Iterable
+from typing import Tuple
 
 import numpy as np
 
-from ..types import Segment
+from .._kernels import NUMBA_MIN_SEGMENTS, orient_len
+from ..types import SegmentsLike, as_segment_array
+from .orientation import _fold_orientation_deg
 
 
-def lengths(segments: Iterable[Segment]) -> np.ndarray:
-    """Return segment lengths as a NumPy array."""
-    return np.array([s.length() for s in segments], dtype=float)
+def lengths(segments: SegmentsLike) -> np.ndarray:
+    """Return segment lengths as a NumPy array.
 
+    Accepts ``Segment`` objects or an ``(N, 4)`` array of ``x1 y1 x2 y2`` rows.
+    """
+    xy = as_segment_array(segments)
+    return np.hypot(xy[:, 2] - xy[:, 0], xy[:, 3] - xy[:, 1])
+
+
+def lengths_and_orientations(segments: SegmentsLike) -> Tuple[np.ndarray, np.ndarray]:
+    """Return ``(lengths, orientations_deg)`` computed from one pass over dx/dy.
+
+    Equivalent to calling :func:`lengths` and ``orientations_deg`` separately,
+    but the endpoint differences are computed only once. Very large inputs
+    use the Numba kernel when it is installed.
+    """
+    xy = as_segment_array(segments)
+    if xy.shape[0] >= NUMBA_MIN_SEGMENTS:
+        res = orient_len(xy)
+        if res is not None:
+            return res
+    dx = xy[:, 2] - xy[:, 0]
+    dy = xy[:, 3] - xy[:, 1]
+    return np.hypot(dx, dy), _fold_orientation_deg(dx, dy)
@@ -1,16 +1,46 @@
 from __future__ import annotations
 
+from functools import lru_cache
 from math import pi
-from typing import Iterable, Tuple
+from typing import Tuple
 
 import numpy as np
 
-from ..types import Segment, TraceMap
+from .._kernels import NUMBA_MIN_SEGMENTS, orient_deg, rose_counts
+from ..types import SegmentsLike, _fold_deg180, as_segment_array
 
 
-def orientations_deg(segments: Iterable[Segment]) -> np.ndarray:
-    """Return orientation angles (degrees) folded to [0, 180)."""
-    return np.array([s.angle_deg() for s in segments], dtype=float)
+def orientations_deg(segments: SegmentsLike) -> np.ndarray:
+    """Return orientation angles (degrees) folded to [0, 180).
+
+    Accepts ``Segment`` objects or an ``(N, 4)`` array of ``x1 y1 x2 y2`` rows;
+    matches ``Segment.angle_deg`` to floating-point rounding.
+    """
+    xy = as_segment_array(segments)
+    return _fold_orientation_deg(xy[:, 2] - xy[:, 0], xy[:, 3] - xy[:, 1])
+
+
+def _fold_orientation_deg(dx: np.ndarray, dy: np.ndarray) -> np.ndarray:
+    """Orientation in degrees folded to [0, 180) from component arrays."""
+    if dx.shape[0] >= NUMBA_MIN_SEGMENTS:
+        a = orient_deg(dx, dy)
+        if a is not None:
+            return a
+    return _fold_deg180(np.degrees(np.arctan2(dy, dx)))
+
+
+# Cosine distance to a bin edge below which rose_hist_segments bins by angle
+_EDGE_COS_TOL = 1e-9
+
+
+@lru_cache(maxsize=16)
+def _rose_edges(bins: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Return cached (edges_deg over 0..360, theta centers in radians); read-only."""
+    edges = np.linspace(0.0, 360.0, bins + 1)
+    theta = np.deg2rad((edges[:-1] + edges[1:]) / 2.0)
+    edges.setflags(write=False)
+    theta.setflags(write=False)
+    return edges, theta
 
 
 def rose_hist(
@@ -28,17 +58,84 @@ def rose_hist(
     bin centers in radians from 0..2π, and radii are counts per mirrored bin.
     """
     a = np.asarray(angles_deg, dtype=float)
+    bins_deg, theta = _rose_edges(bins)
     if bidirectional:
-        a = np.mod(a, 180.0)
-        # Mirror to 0..360 by duplicating with +180
-        a_full = np.concatenate([a, (a + 180.0)])
-        bins_deg = np.linspace(0.0, 360.0, bins + 1)
+        if bins % 2 == 0:
+            # The +180 mirror of a sample lands in the matching bin of the other
+            # half: histogram 0..180 once and repeat it for the mirror
+            half = bins // 2
+            a = np.mod(a, 180.0)
+            # np.mod can round tiny negatives up to 180 itself, i.e. 0
+            a[a >= 180.0] = 0.0
+            counts, _ = np.histogram(a, bins=bins_deg[: half + 1])
+            mirror = counts.copy()
+            # a + 180 can round onto the next edge: re-bin samples next to one
+            r = a * (bins / 360.0)
+            near = np.abs(r - np.rint(r)) < 1e-9
+            if near.any():
+                a_near = a[near]
+                mirror -= np.histogram(a_near, bins=bins_deg[: half + 1])[0]
+                mirror += np.histogram(a_near + 180.0, bins=bins_deg[half:])[0]
+            return theta.copy(), np.concatenate((counts, mirror)).astype(float)
+        # Mirror to 0..360: fold into the first half of one buffer, +180 into the second
+        n = a.size
+        a_full = np.empty(2 * n, dtype=float)
+        np.mod(a.ravel(), 180.0, out=a_full[:n])
+        np.add(a_full[:n], 180.0, out=a_full[n:])
     else:
         a_full = np.mod(a, 360.0)
-        bins_deg = np.linspace(0.0, 360.0, bins + 1)
 
-    counts, edges = np.histogram(a_full, bins=bins_deg)
-    centers_deg = (edges[:-1] + edges[1:]) / 2.0
-    theta = np.deg2rad(centers_deg)
-    return theta, counts.astype(float)
+    counts, _ = np.histogram(a_full, bins=bins_deg)
+    return theta.copy(), counts.astype(float)
+
+
+
+def rose_hist_segments(
+    segments: SegmentsLike,
+    bins: int = 18,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Bidirectional rose histogram computed straight from segment vectors.
+
+    Same result as ``rose_hist(orientations_deg(segments), bins)`` but without
+    per-segment trigonometry: each segment is folded to the upper half-plane
+    as a unit vector and its cosine is binned against the cosines of the bin
+    edges (the angle is monotonic in the cosine over [0, 180]). The few
+    segments whose cosine is within rounding of an edge, or of 0/180 degrees,
+    are binned from their ``atan2`` angle so they land where ``rose_hist``
+    puts them. Large arrays use a fused Numba kernel when it is available.
+    """
+    xy = as_segment_array(segments)
+    edges, theta = _rose_edges(bins)
+    if xy.shape[0] >= NUMBA_MIN_SEGMENTS:
+        counts = rose_counts(xy, edges)
+        if counts is not None:
+            return theta.copy(), counts.astype(float)
+    dx0 = xy[:, 2] - xy[:, 0]
+    dy0 = xy[:, 3] - xy[:, 1]
+    # Fold to [0, 180): flip vectors pointing into the lower half-plane
+    flip = (dy0 < 0) | ((dy0 == 0) & (dx0 < 0))
+    dx = np.where(flip, -dx0, dx0)
+    norm = np.hypot(dx, dy0)
+    # Zero-length segments have orientation 0 (atan2(0, 0) == 0)
+    c = np.divide(dx, norm, out=np.ones_like(dx), where=norm > 0)
 
+    lo = edges[(edges > 0.0) & (edges <= 180.0)]
+    hi = edges[(edges > 180.0) & (edges < 360.0)] - 180.0
+    # angle >= edge  <=>  cos(angle) <= cos(edge); negate for ascending keys
+    keys_lo = -np.cos(np.deg2rad(lo))
+    keys_hi = -np.cos(np.deg2rad(hi))
+    # Cosines this close to an edge (or to +-1, where 180 folds to 0) may bin
+    # differently from the rounded angle: leave them to the exact path
+    keys = np.unique(np.concatenate((keys_lo, keys_hi, [-1.0, 1.0])))
+    j = np.searchsorted(keys, -c)
+    near = (np.abs(keys[np.minimum(j, keys.size - 1)] + c) <= _EDGE_COS_TOL) | (
+        np.abs(keys[np.maximum(j - 1, 0)] + c) <= _EDGE_COS_TOL
+    )
+    c_far = c[~near]
+    idx = np.searchsorted(keys_lo, -c_far, side="right")
+    idx_mirror = lo.size + np.searchsorted(keys_hi, -c_far, side="right")
+    counts = np.bincount(idx, minlength=bins) + np.bincount(idx_mirror, minlength=bins)
+    counts = counts[:bins].astype(float)
+    if near.any():
+        counts += rose_hist(_fold_orientation_deg(dx0[near], dy0[near]), bins)[1]
+    return theta.copy(), counts
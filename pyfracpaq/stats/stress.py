@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+from typing import Tuple
+
+import numpy as np
+
+from .._kernels import NUMBA_MIN_SEGMENTS, slip_stresses as _slip_stresses_kernel
+
+
+def slip_stresses(
+    orientations_deg: np.ndarray,
+    sigma1: float,
+    sigma2: float,
+    theta_sigma1: float,
+    flip_x: bool = False,
+    flip_y: bool = False,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Resolve a 2D stress field onto segments of the given orientations.
+
+    - orientations_deg: segment orientations from the X-axis in [0, 180)
+    - sigma1, sigma2: principal stresses (MPa)
+    - theta_sigma1: angle of sigma 1 from the Y-axis (degrees)
+    - flip_x, flip_y: mirror the orientations as the flipped map axes do
+
+    Returns ``(angN, sigma_n, tau, ts_norm)``: North-based orientations, normal
+    and shear stress, and slip tendency ``|tau| / |sigma_n|`` normalised by its
+    maximum at ``theta = 0`` on the unflipped orientations (MATLAB FracPaQ
+    convention), clipped to [0, 1]. Very large inputs use the Numba kernel
+    when it is installed.
+    """
+    angX = np.asarray(orientations_deg, dtype=np.float64)
+    if angX.shape[0] >= NUMBA_MIN_SEGMENTS:
+        res = _slip_stresses_kernel(angX, sigma1, sigma2, theta_sigma1, flip_x, flip_y)
+        if res is not None:
+            angN, sn, tau, ratios, ratios0 = res
+            return angN, sn, tau, _normalise_ratios(ratios, ratios0)
+
+    mean = 0.5 * (sigma1 + sigma2)
+    half = 0.5 * (sigma1 - sigma2)
+    # Convert segment angle from X-axis to North-based: angN = (90 - angX)
+    ang0 = np.mod(90.0 - angX, 180.0)
+    angN = ang0
+    # Each flip mirrors the angle (reverseAxis behavior)
+    if flip_x:
+        angN = np.mod(180.0 - angN, 180.0)
+    if flip_y:
+        angN = np.mod(180.0 - angN, 180.0)
+    two_alpha = np.deg2rad(2.0 * ((angN + 90.0) - theta_sigma1))
+    sn = mean + half * np.cos(two_alpha)
+    tau = -half * np.sin(two_alpha)
+    # Tsmax with alpha0 = angN + 90 (independent of theta), and without flips
+    two_alpha0 = np.deg2rad(2.0 * (ang0 + 90.0))
+    sn0 = mean + half * np.cos(two_alpha0)
+    tau0 = -half * np.sin(two_alpha0)
+    return angN, sn, tau, _normalise_ratios(_ratio(tau, sn), _ratio(tau0, sn0))
+
+
+def _ratio(tau: np.ndarray, sn: np.ndarray) -> np.ndarray:
+    """``|tau| / |sn|``, zero where ``sn`` is zero."""
+    a = np.abs(sn)
+    out = np.zeros_like(a)
+    np.divide(np.abs(tau), a, out=out, where=a > 0)
+    return out
+
+
+def _normalise_ratios(ratios: np.ndarray, ratios0: np.ndarray) -> np.ndarray:
+    tsmax = float(ratios0.max()) if ratios0.size else 1.0
+    if tsmax <= 0:
+        tsmax = 1.0
+    return np.clip(ratios / tsmax, 0.0, 1.0)
@@ -2,7 +2,9 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from math import atan2, degrees, sqrt
-from typing import Iterable, List, Tuple
+from typing import Iterable, Iterator, List, Optional, Tuple, Union
+
+import numpy as np
 
 
 @dataclass(frozen=True)
@@ -18,6 +20,24 @@ class Segment:
     x2: float
     y2: float
 
+    @classmethod
+    def _from_rows(cls, rows: List[List[float]]) -> List["Segment"]:
+        """Build one segment per ``x1 y1 x2 y2`` row, skipping ``__init__``.
+
+        The frozen ``__init__`` sets each field through ``object.__setattr__``;
+        filling the instance dicts directly is about a third faster on large
+        files and gives equal (and equally frozen) objects.
+        """
+        new = object.__new__
+        out = [new(cls) for _ in range(len(rows))]
+        for s, (x1, y1, x2, y2) in zip(out, rows):
+            d = s.__dict__
+            d["x1"] = x1
+            d["y1"] = y1
+            d["x2"] = x2
+            d["y2"] = y2
+        return out
+
     def length(self) -> float:
         dx = self.x2 - self.x1
         dy = self.y2 - self.y1
@@ -56,25 +76,132 @@ class Trace:
 
 @dataclass
 class TraceMap:
-    """A collection of traces composing a map."""
+    """A collection of traces composing a map.
+
+    Besides the ``Trace``/``Segment`` objects, the segment endpoints are kept
+    as one ``(N, 4)`` ``x1 y1 x2 y2`` array (built on first use) so limits,
+    lengths and angles are computed with vectorized NumPy calls. The array
+    and the derived lengths/angles are cached; call :meth:`invalidate` after
+    changing ``traces``. Maps made by :meth:`from_xy_array` start from the
+    array alone and build ``traces`` only when it is first accessed.
+    """
 
     traces: List[Trace] = field(default_factory=list)
+    _xy: Optional[np.ndarray] = field(default=None, init=False, repr=False, compare=False)
+    _lengths: Optional[np.ndarray] = field(default=None, init=False, repr=False, compare=False)
+    _angles_deg: Optional[np.ndarray] = field(default=None, init=False, repr=False, compare=False)
 
     @classmethod
     def from_segments(cls, segments: Iterable[Segment]) -> "TraceMap":
         return cls(traces=[Trace([s]) for s in segments])
 
+    @classmethod
+    def from_xy_array(cls, xy: np.ndarray) -> "TraceMap":
+        """Build a map of single-segment traces from an ``(N, 4)`` array.
+
+        No ``Trace``/``Segment`` objects are created up front: array-based
+        statistics use ``xy`` directly, and ``traces`` is materialized on
+        first access.
+        """
+        tm = cls()
+        # A view, so marking it read-only leaves the caller's array untouched
+        arr = np.ascontiguousarray(xy, dtype=np.float64).reshape(-1, 4).view()
+        arr.flags.writeable = False
+        tm._xy = arr
+        del tm.__dict__["traces"]
+        return tm
+
+    def __getattr__(self, name: str):
+        # Only reached while ``traces`` is still pending (see from_xy_array)
+        if name == "traces" and self.__dict__.get("_xy") is not None:
+            traces = [Trace([s]) for s in Segment._from_rows(self._xy.tolist())]
+            self.__dict__["traces"] = traces
+            return traces
+        raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
+
+    def __iter__(self) -> Iterator[Segment]:
+        """Iterate over all segments, as ``Segment`` rows built on demand."""
+        return (Segment(*row) for row in self.segment_array().tolist())
+
     def all_segments(self) -> List[Segment]:
         return [s for t in self.traces for s in t.segments]
 
+    def invalidate(self) -> None:
+        """Drop cached arrays so they are rebuilt from ``traces`` on next use."""
+        self._lengths = self._angles_deg = None
+        if "traces" in self.__dict__:
+            # Otherwise the array is still the only copy of the data
+            self._xy = None
+
+    def segment_array(self) -> np.ndarray:
+        """Return all segments as an ``(N, 4)`` float64 array (shared, do not modify)."""
+        if self._xy is None:
+            n = sum(len(t.segments) for t in self.traces)
+            xy = np.fromiter(
+                (v for t in self.traces for s in t.segments for v in (s.x1, s.y1, s.x2, s.y2)),
+                dtype=np.float64,
+                count=4 * n,
+            ).reshape(-1, 4)
+            xy.flags.writeable = False
+            self._xy = xy
+        return self._xy
+
+    def segment(self, i: int) -> Segment:
+        """Return segment ``i`` (in ``all_segments`` order) from the array storage."""
+        return Segment(*(float(v) for v in self.segment_array()[i]))
+
+    def lengths(self) -> np.ndarray:
+        """Return the length of every segment (cached, read-only)."""
+        if self._lengths is None:
+            xy = self.segment_array()
+            lens = np.hypot(xy[:, 2] - xy[:, 0], xy[:, 3] - xy[:, 1])
+            lens.flags.writeable = False
+            self._lengths = lens
+        return self._lengths
+
+    def angles_deg(self) -> np.ndarray:
+        """Return every segment orientation in degrees within [0, 180) (cached, read-only)."""
+        if self._angles_deg is None:
+            xy = self.segment_array()
+            a = _fold_deg180(np.degrees(np.arctan2(xy[:, 3] - xy[:, 1], xy[:, 2] - xy[:, 0])))
+            a.flags.writeable = False
+            self._angles_deg = a
+        return self._angles_deg
+
     def map_limits(self) -> Tuple[float, float, float, float]:
         """Return (xmin, xmax, ymin, ymax) limits across all segments."""
-        xs: List[float] = []
-        ys: List[float] = []
-        for s in self.all_segments():
-            xs.extend([s.x1, s.x2])
-            ys.extend([s.y1, s.y2])
-        if not xs or not ys:
+        xy = self.segment_array()
+        if not xy.shape[0]:
             return (0.0, 0.0, 0.0, 0.0)
-        return (min(xs), max(xs), min(ys), max(ys))
+        xs = xy[:, 0::2]
+        ys = xy[:, 1::2]
+        return (float(xs.min()), float(xs.max()), float(ys.min()), float(ys.max()))
+
+
+def _fold_deg180(a: np.ndarray) -> np.ndarray:
+    """Fold ``arctan2`` output in degrees, (-180, 180], to [0, 180).
+
+    Branch-free add/subtract instead of ``np.mod`` (no division); results match
+    ``a % 180`` except that tiny negative angles map to 0 instead of 180.
+    """
+    a = a + 180.0 * (a < 0.0)
+    a[a >= 180.0] -= 180.0
+    a[np.abs(a) < 1e-12] = 0.0
+    return a
 
+
+SegmentsLike = Union[Iterable[Segment], np.ndarray]
+
+
+def as_segment_array(segments: SegmentsLike) -> np.ndarray:
+    """Return segments as an ``(N, 4)`` float array of ``x1 y1 x2 y2`` rows.
+
+    Floating-point arrays are passed through as-is (dtype and memory layout
+    kept, no copy); iterables of ``Segment`` are packed row by row.
+    """
+    if isinstance(segments, np.ndarray):
+        if segments.dtype.kind != "f":
+            segments = segments.astype(float)
+        return segments.reshape(-1, 4)
+    rows = [(s.x1, s.y1, s.x2, s.y2) for s in segments]
+    return np.array(rows, dtype=float).reshape(-1, 4)